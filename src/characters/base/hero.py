@@ -16,6 +16,7 @@ class Hero(DungeonCharacter):
 
     Attributes:
         class_name (str): The name of the hero's class
+        portrait_key (str): Key of the hero's portrait in the combat UI
         _block_chance (float): Probability (0.0-1.0) of blocking an attack
         _healing_potions (int): Count of healing potions in inventory
         _vision_potions (int): Count of vision potions in inventory
@@ -46,6 +47,7 @@ class Hero(DungeonCharacter):
         super().__init__(name, hp, min_damage, max_damage, attack_speed, hit_chance)
 
         self.class_name = self.__class__.__name__
+        self.portrait_key = self.class_name
         self._block_chance = block_chance
         self._healing_potions = 0
         self._vision_potions = 0
@@ -15,6 +15,7 @@ class Monster(DungeonCharacter, ABC):
         heal_chance (float): Probability of healing after taking damage
         min_heal (int): Minimum amount of healing when triggered
         max_heal (int): Maximum amount of healing when triggered
+        portrait_key (str): Key of the monster's portrait in the combat UI
     """
 
     def __init__(self,
@@ -45,6 +46,7 @@ class Monster(DungeonCharacter, ABC):
         self.heal_chance = heal_chance
         self.min_heal = min_heal
         self.max_heal = max_heal
+        self.portrait_key = type(self).__name__
 
     def take_damage(self, amount: int) -> int:
         """
@@ -1,3 +1,4 @@
+import sys
 import uuid
 from typing import Tuple
 
@@ -26,7 +27,7 @@ class SqliteRoomMonster:
         self.max_heal = monster.max_heal
 
 class SqliteRoom:
-    def __init__(self, position: Tuple[int, int], room: Room):
+    def __init__(self, position: Tuple[int, int], room: Room, visited: bool):
         self.room_id = str(uuid.uuid4())
         self.x_pos = position[0]
         self.y_pos = position[1]
@@ -38,7 +39,7 @@ class SqliteRoom:
         self.doors = result = ','.join([str(door) for door in room.doors.values()])
         self.is_exit = room.isExit
         self.is_entrance = room.isEntrance
-        self.visited = room.visited
+        self.visited = visited
 
 class SqliteDungeon:
     def __init__(self, dungeon: Dungeon):
@@ -131,7 +132,7 @@ class SqliteDungeonConfiguration(SqliteConfiguration):
         for x in range(dungeon.size[0]):
             for y in range(dungeon.size[1]):
                 room = dungeon.get_room(x, y)
-                sqlite_room = SqliteRoom((x,y),room)
+                sqlite_room = SqliteRoom((x,y),room,dungeon.is_visited(x, y))
                 cursor.execute(f"INSERT INTO dungeon_rooms VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", (
                     sqlite_room.room_id,
                     sqlite_room.x_pos,
@@ -173,9 +174,7 @@ class SqliteDungeonConfiguration(SqliteConfiguration):
         if sqlite_dungeon is None:
             return False
 
-        dungeon = Dungeon()
-        dungeon.size = (sqlite_dungeon[1], sqlite_dungeon[2])
-        dungeon.maze = [[Room() for _ in range(dungeon.size[0])] for _ in range(dungeon.size[1])]
+        dungeon = Dungeon((sqlite_dungeon[1], sqlite_dungeon[2]))
         dungeon.entrance = (sqlite_dungeon[3], sqlite_dungeon[4])
         dungeon.exit= (sqlite_dungeon[5], sqlite_dungeon[6])
 
@@ -183,9 +182,9 @@ class SqliteDungeonConfiguration(SqliteConfiguration):
             room = Room()
             room.hasPit = sql_room[3] == 1
             room.hasHealthPot = sql_room[4] == 1
-            room.hasVision = sql_room[5] == 1
+            room.hasVisionPot = sql_room[5] == 1
             room.hasPillar = sql_room[6] == 1
-            room.pillarType = sql_room[7]
+            room.pillarType = sys.intern(sql_room[7]) if sql_room[7] is not None else None
             has_door = sql_room[8].split(",")
             doors = {
                 'N': has_door[0]== "True", 'S': has_door[1]== "True",
@@ -194,7 +193,6 @@ class SqliteDungeonConfiguration(SqliteConfiguration):
             room.doors = doors
             room.isExit = sql_room[9] == 1
             room.isEntrance = sql_room[10] == 1
-            room.visited = sql_room[11] == 1
 
             sql_monster = self.load_dungeon_room_monster(cursor, sql_room[0])
             if(sql_monster is not None):
@@ -212,6 +210,8 @@ class SqliteDungeonConfiguration(SqliteConfiguration):
                 room.monster = monster
 
             dungeon.maze[sql_room[2]][sql_room[1]] = room
+            if sql_room[11] == 1:
+                dungeon.mark_visited(sql_room[1], sql_room[2])
 
 
         print("Loading Hero")
@@ -1,4 +1,5 @@
 import random
+from itertools import product
 
 from pygame.cursors import Cursor
 
@@ -54,16 +55,21 @@ class SqliteMonsterConfiguration(MonsterConfiguration, SqliteConfiguration):
     def configure(self, dungeon):
         monsters = self._create_monsters()
         placed_monsters = []
-        count_monster_to_place = min(len(monsters), dungeon.size[0]*dungeon.size[1])
-        monster = monsters.pop()
+        width, height = dungeon.size
+        maze = dungeon.maze
+        count_monster_to_place = min(len(monsters), width * height)
+        rnd = random.random
+        cells = list(product(range(width), range(height)))
         while count_monster_to_place > 0:
-            for i in range(dungeon.size[0]):
-                for j in range(dungeon.size[1]):
-                    room = dungeon.get_room(i, j)
-                    if room.monster is None and random.random() < 0.3:
-                        room.place_monster(monster)
-                        placed_monsters.append(monster)
-                        if len(monsters) > 0 :
-                            monster = monsters.pop()
-                        count_monster_to_place -= 1
-        return placed_monsters
\ No newline at end of file
+            # One roll per room for this sweep, drawn together
+            rolls = [rnd() for _ in cells]
+            for (x, y), roll in zip(cells, rolls):
+                room = maze[y][x]
+                if room.monster is None and roll < 0.3:
+                    monster = monsters.pop()
+                    room.place_monster(monster)
+                    placed_monsters.append(monster)
+                    count_monster_to_place -= 1
+                    if count_monster_to_place == 0:
+                        break
+        return placed_monsters
@@ -61,18 +61,15 @@ class DFSDungeonFactory(DungeonFactory):
         The grid is prepared as a blank canvas for the maze generation
         algorithm to create pathways and connections.
         """
-        self.dungeon.maze = []
-        for y in range(self.dungeon.size[1]):
-            row = []
-            for x in range(self.dungeon.size[0]):
-                row.append(Room())
-            self.dungeon.maze.append(row)
+        dungeon = self.dungeon
+        width, height = dungeon.size
+        maze = dungeon.maze = [[Room() for _ in range(width)] for _ in range(height)]
 
         # Set entrance and exit
-        self.dungeon.entrance = (0, 0)
-        self.dungeon.exit = (self.dungeon.size[0] - 1, self.dungeon.size[1] - 1)
-        self.dungeon.maze[0][0].isEntrance = True
-        self.dungeon.maze[self.dungeon.size[1] - 1][self.dungeon.size[0] - 1].isExit = True
+        dungeon.entrance = (0, 0)
+        dungeon.exit = (width - 1, height - 1)
+        maze[0][0].isEntrance = True
+        maze[height - 1][width - 1].isExit = True
 
     def generate_maze_dfs(self) -> None:
         """
@@ -96,6 +93,9 @@ class DFSDungeonFactory(DungeonFactory):
         The randomness ensures each generated dungeon is unique while
         maintaining full connectivity.
         """
+        maze = self.dungeon.maze
+        width, height = self.dungeon.size
+        opposite = {'N': 'S', 'S': 'N', 'E': 'W', 'W': 'E'}
         visited = set()
         stack = [self.dungeon.entrance]
 
@@ -114,8 +114,8 @@ class DFSDungeonFactory(DungeonFactory):
             ]
 
             for direction, (nx, ny) in possible_moves:
-                if (0 <= nx < self.dungeon.size[0] and
-                        0 <= ny < self.dungeon.size[1] and
+                if (0 <= nx < width and
+                        0 <= ny < height and
                         (nx, ny) not in visited):
                     neighbors.append((direction, (nx, ny)))
 
@@ -124,9 +124,8 @@ class DFSDungeonFactory(DungeonFactory):
                 nx, ny = next_cell
 
                 # Create path between cells
-                self.dungeon.maze[y][x].doors[direction] = True
-                opposite = {'N': 'S', 'S': 'N', 'E': 'W', 'W': 'E'}
-                self.dungeon.maze[ny][nx].doors[opposite[direction]] = True
+                maze[y][x].doors[direction] = True
+                maze[ny][nx].doors[opposite[direction]] = True
 
                 stack.append(next_cell)
             else:
@@ -148,14 +147,19 @@ class DFSDungeonFactory(DungeonFactory):
         The method ensures that added connections do not compromise
         the overall dungeon structure or connectivity.
         """
-        for y in range(self.dungeon.size[1]):
-            for x in range(self.dungeon.size[0]):
-                if x < self.dungeon.size[0] - 1:
-                    if random.random() < 0.15:  # 15% chance
-                        self.dungeon.maze[y][x].doors['E'] = True
-                        self.dungeon.maze[y][x + 1].doors['W'] = True
-
-                if y < self.dungeon.size[1] - 1:
-                    if random.random() < 0.15:
-                        self.dungeon.maze[y][x].doors['S'] = True
-                        self.dungeon.maze[y + 1][x].doors['N'] = True
\ No newline at end of file
+        maze = self.dungeon.maze
+        width, height = self.dungeon.size
+        rnd = random.random
+
+        for y in range(height):
+            row = maze[y]
+            for x in range(width):
+                if x < width - 1:
+                    if rnd() < 0.15:  # 15% chance
+                        row[x].doors['E'] = True
+                        row[x + 1].doors['W'] = True
+
+                if y < height - 1:
+                    if rnd() < 0.15:
+                        row[x].doors['S'] = True
+                        maze[y + 1][x].doors['N'] = True
@@ -1,8 +1,15 @@
 # src/dungeon/dungeon.py
 from typing import Tuple, Optional, List, Dict
 import random
+import sys
 from src.combat.combat_system import CombatSystem
-from src.dungeon.room import Room
+from src.dungeon.room import Room, DOOR_BITS
+
+# (direction, dx, dy) for each door a room can have
+_MOVES = (('N', 0, -1), ('S', 0, 1), ('E', 1, 0), ('W', -1, 0))
+_STEPS = {direction: (dx, dy) for direction, dx, dy in _MOVES}
+_OPPOSITE = {'N': 'S', 'S': 'N', 'E': 'W', 'W': 'E'}
+
 
 class Dungeon:
     """
@@ -38,6 +45,71 @@ class Dungeon:
         self.entrance: Optional[Tuple[int, int]] = None
         self.exit: Optional[Tuple[int, int]] = None
         self.pillar_locations = []  # List of (pillar_type, x, y) tuples
+        # One byte per room (index y * width + x), set once the hero has seen it
+        self._visited = bytearray(size[0] * size[1])
+        # Bumped whenever a room is newly visited or visited rooms are cleared
+        self._visited_version = 0
+
+    def mark_visited(self, x: int, y: int) -> None:
+        """
+        Record that the hero has seen the room at the given coordinates.
+
+        The dungeon is the only record of which rooms have been seen;
+        rooms themselves don't track it.
+
+        Args:
+            x (int): X-coordinate in the dungeon grid
+            y (int): Y-coordinate in the dungeon grid
+        """
+        index = y * self.size[0] + x
+        if not self._visited[index]:
+            self._visited[index] = 1
+            self._visited_version += 1
+
+    def is_visited(self, x: int, y: int) -> bool:
+        """
+        Check whether the room at the given coordinates has been seen.
+
+        Args:
+            x (int): X-coordinate in the dungeon grid
+            y (int): Y-coordinate in the dungeon grid
+
+        Returns:
+            bool: True if the room was marked visited
+        """
+        return bool(self._visited[y * self.size[0] + x])
+
+    @property
+    def visited_version(self) -> int:
+        """
+        Counter that changes whenever the set of visited rooms changes.
+
+        A cheaper stand-in for comparing visited_state() snapshots: equal
+        versions mean no room was revealed or forgotten in between.
+
+        Returns:
+            int: The current version
+        """
+        return self._visited_version
+
+    def visited_state(self) -> bytes:
+        """
+        Snapshot which rooms have been seen.
+
+        Two equal snapshots mean no room was revealed or forgotten in
+        between, which lets views cache anything drawn from it.
+
+        Returns:
+            bytes: One byte per room (index y * width + x), nonzero if visited
+        """
+        return bytes(self._visited)
+
+    def clear_visited(self) -> None:
+        """
+        Forget every visited room, returning the dungeon to unexplored.
+        """
+        self._visited = bytearray(self.size[0] * self.size[1])
+        self._visited_version += 1
 
     def reveal_adjacent_rooms(self, center_pos: Tuple[int, int]) -> List[Tuple[int, int]]:
         """
@@ -63,7 +135,7 @@ class Dungeon:
         for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]:
             new_x, new_y = x + dx, y + dy
             if 0 <= new_x < self.size[0] and 0 <= new_y < self.size[1]:
-                self.maze[new_y][new_x].visited = True
+                self.mark_visited(new_x, new_y)
                 revealed.append((new_x, new_y))
 
         return revealed
@@ -84,7 +156,9 @@ class Dungeon:
         Returns:
             bool: True if a path exists, False otherwise
         """
-        visited = set()
+        maze = self.maze
+        width, height = self.size
+        visited = {start}
         stack = [start]
 
         while stack:
@@ -92,22 +166,54 @@ class Dungeon:
             if current == target:
                 return True
 
-            if current not in visited:
-                visited.add(current)
-                x, y = current
+            x, y = current
+            doors = maze[y][x].doors
 
-                # Check all possible moves from current position
-                if self.maze[y][x].doors['N'] and y > 0:
-                    stack.append((x, y - 1))
-                if self.maze[y][x].doors['S'] and y < self.size[1] - 1:
-                    stack.append((x, y + 1))
-                if self.maze[y][x].doors['E'] and x < self.size[0] - 1:
-                    stack.append((x + 1, y))
-                if self.maze[y][x].doors['W'] and x > 0:
-                    stack.append((x - 1, y))
+            # Queue each unseen neighbor behind an open door exactly once
+            for direction, dx, dy in _MOVES:
+                if not doors[direction]:
+                    continue
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height and (nx, ny) not in visited:
+                    visited.add((nx, ny))
+                    stack.append((nx, ny))
 
         return False
 
+    def door_masks(self) -> bytearray:
+        """
+        Snapshot the door layout as one contiguous byte per room.
+
+        Rooms are laid out row by row, so the room at (x, y) sits at
+        index y * width + x and holds its Room.door_mask() bits.
+
+        Returns:
+            bytearray: Door bitmask for every room in the grid
+        """
+        return bytearray(room.door_mask() for row in self.maze for room in row)
+
+    def apply_door_masks(self, masks: bytearray) -> None:
+        """
+        Write a flat door bitmask buffer back onto the room grid.
+
+        This is the inverse of door_masks(); every room's doors dict is
+        overwritten from its byte.
+
+        Args:
+            masks (bytearray): Door bitmask per room, row by row
+        """
+        n, s, e, w = DOOR_BITS['N'], DOOR_BITS['S'], DOOR_BITS['E'], DOOR_BITS['W']
+        i = 0
+        for row in self.maze:
+            for room in row:
+                mask = masks[i]
+                doors = room.doors
+                doors['N'] = bool(mask & n)
+                doors['S'] = bool(mask & s)
+                doors['E'] = bool(mask & e)
+                doors['W'] = bool(mask & w)
+                i += 1
+
     def get_room(self, x: int, y: int) -> Optional[Room]:
         """
         Retrieve the room at specific coordinates.
@@ -145,16 +251,8 @@ class Dungeon:
             Optional[Tuple[int, int]]: Coordinates of the room in the specified direction
         """
         x, y = current_pos
-        new_x, new_y = x, y
-
-        if direction == 'N':
-            new_y -= 1
-        elif direction == 'S':
-            new_y += 1
-        elif direction == 'E':
-            new_x += 1
-        elif direction == 'W':
-            new_x -= 1
+        dx, dy = _STEPS.get(direction, (0, 0))
+        new_x, new_y = x + dx, y + dy
 
         # Check if new position would be in bounds
         if 0 <= new_x < self.size[0] and 0 <= new_y < self.size[1]:
@@ -192,24 +290,26 @@ class Dungeon:
         if not hero.location:
             return False, ["No current location!"], None
 
-        current_room = self.get_room(*hero.location)
-        if not current_room or not current_room.doors[direction]:
+        maze = self.maze
+        width, height = self.size
+        x, y = hero.location
+        if not (0 <= x < width and 0 <= y < height) or not maze[y][x].doors[direction]:
             return False, ["You cannot move in that direction."], None
 
         # Calculate new position
-        new_pos = self.get_room_in_direction(hero.location, direction)
-        if not new_pos:
+        dx, dy = _STEPS[direction]
+        new_x, new_y = x + dx, y + dy
+        if not (0 <= new_x < width and 0 <= new_y < height):
             return False, ["You cannot move in that direction."], None
 
         # Check connecting door
-        new_room = self.get_room(*new_pos)
-        opposite_directions = {'N': 'S', 'S': 'N', 'E': 'W', 'W': 'E'}
-        if not new_room.doors[opposite_directions[direction]]:
+        new_room = maze[new_y][new_x]
+        if not new_room.doors[_OPPOSITE[direction]]:
             return False, ["You cannot move in that direction."], None
 
         # Move is valid - update position
-        hero.location = new_pos
-        new_room.visited = True
+        hero.location = (new_x, new_y)
+        self.mark_visited(new_x, new_y)
 
         # Apply room effects and get messages
         messages = self.apply_room_effects(hero)
@@ -302,12 +402,57 @@ class Dungeon:
             Dict[Tuple[int, int], Room]:
                 Dictionary of visited room coordinates and their instances
         """
+        width = self.size[0]
+        maze = self.maze
         visible = {}
+        for i, seen in enumerate(self._visited):
+            if seen:
+                y, x = divmod(i, width)
+                visible[(x, y)] = maze[y][x]
+        return visible
+
+    def render(self) -> None:
+        """
+        Write a developer view of the dungeon layout to stdout.
+
+        Shows the dungeon size, entrance and exit locations, the walls
+        and doors between rooms, and pillar rooms. The whole layout is
+        built first and written with a single stdout call.
+        """
+        lines = [
+            "",
+            "=== Dungeon Layout ===",
+            f"Size: {self.size}",
+            f"Entrance: {self.entrance}",
+            f"Exit: {self.exit}",
+        ]
+
+        # Layout with walls and doors
         for y in range(self.size[1]):
+            # Horizontal walls for this row
+            wall_line = ""
+            room_line = ""
             for x in range(self.size[0]):
-                if self.maze[y][x].visited:
-                    visible[(x, y)] = self.maze[y][x]
-        return visible
+                room = self.maze[y][x]
+                # North wall/door
+                wall_line += "+---" if not room.doors['N'] else "+-|-"
+                # Room identifier and east wall/door
+                if (x, y) == self.entrance:
+                    room_char = "E"
+                elif (x, y) == self.exit:
+                    room_char = "X"
+                elif room.hasPillar:
+                    room_char = room.pillarType
+                else:
+                    room_char = " "
+                room_line += f"|{room_char:^3}" if not room.doors['E'] else f"|{room_char:^3} "
+            lines.append(wall_line + "+")
+            lines.append(room_line + "|")
+
+        # Bottom wall
+        lines.append("+---" * self.size[0] + "+")
+        lines.append("=====================")
+        sys.stdout.write('\n'.join(lines) + '\n\n')
 
     def __str__(self) -> str:
         """
@@ -323,8 +468,9 @@ class Dungeon:
             str: Textual representation of the dungeon layout
         """
         result = []
-        for row in self.maze:
-            room_lines = [str(room).split('\n') for room in row]
+        for y, row in enumerate(self.maze):
+            room_lines = [room.ascii_art(self.is_visited(x, y)).split('\n')
+                          for x, room in enumerate(row)]
             if result:
                 result.append('     ' * len(row))
             for i in range(3):
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 import random
+from itertools import product
 from typing import Tuple
 
 from src.configuration.dungeon_configuration_service import DungeonConfigurationService
@@ -109,18 +110,20 @@ class DungeonFactory(ABC):
         """
         valid = True
         print("\nVerifying door connections...")
-        for y in range(dungeon.size[1]):
-            for x in range(dungeon.size[0]):
-                room = dungeon.maze[y][x]
+        maze = dungeon.maze
+        width, height = dungeon.size
+        for y in range(height):
+            for x in range(width):
+                room = maze[y][x]
                 # Check east connections
-                if x < dungeon.size[0] - 1:
-                    next_room = dungeon.maze[y][x + 1]
+                if x < width - 1:
+                    next_room = maze[y][x + 1]
                     if room.doors['E'] != next_room.doors['W']:
                         print(f"ERROR: Door mismatch at ({x}, {y}) East/West")
                         valid = False
                 # Check south connections
-                if y < dungeon.size[1] - 1:
-                    next_room = dungeon.maze[y + 1][x]
+                if y < height - 1:
+                    next_room = maze[y + 1][x]
                     if room.doors['S'] != next_room.doors['N']:
                         print(f"ERROR: Door mismatch at ({x}, {y}) South/North")
                         valid = False
@@ -142,44 +145,14 @@ class DungeonFactory(ABC):
         - Special room contents (pillars, etc.)
 
         Provides a human-readable visualization of the generated dungeon.
+        Kept for callers of the factory API; see Dungeon.render().
 
         Args:
             dungeon (Dungeon): The dungeon to visualize
         """
-        print("\n=== Dungeon Layout ===")
-        print(f"Size: {dungeon.size}")
-        print(f"Entrance: {dungeon.entrance}")
-        print(f"Exit: {dungeon.exit}")
+        dungeon.render()
 
-        # Print layout with walls and doors
-        for y in range(dungeon.size[1]):
-            # Print horizontal walls for this row
-            wall_line = ""
-            room_line = ""
-            for x in range(dungeon.size[0]):
-                room = dungeon.get_room(x, y)
-                # Print north wall/door
-                wall_line += "+---" if not room.doors['N'] else "+-|-"
-                # Print room identifier and east wall/door
-                if (x, y) == dungeon.entrance:
-                    room_char = "E"
-                elif (x, y) == dungeon.exit:
-                    room_char = "X"
-                elif room.hasPillar:
-                    room_char = room.pillarType
-                else:
-                    room_char = " "
-                room_line += f"|{room_char:^3}" if not room.doors['E'] else f"|{room_char:^3} "
-            wall_line += "+"
-            room_line += "|"
-            print(wall_line)
-            print(room_line)
-
-        # Print bottom wall
-        print("+---" * dungeon.size[0] + "+")
-        print("=====================\n")
-
-    def populate_rooms(self, dungeon: Dungeon) -> None:
+    def populate_rooms(self, dungeon: Dungeon) -> Dungeon:
         """
         Comprehensive method to fill the dungeon with content.
 
@@ -189,10 +162,15 @@ class DungeonFactory(ABC):
         3. Distribute other items
 
         Ensures strategic placement of game elements while
-        maintaining dungeon playability.
+        maintaining dungeon playability. Population does no terminal
+        output; call Dungeon.render() or verify_door_connections()
+        explicitly when the layout should be shown.
 
         Args:
             dungeon (Dungeon): The dungeon to populate
+
+        Returns:
+            Dungeon: The populated dungeon
         """
         # First place pillars
         self.place_pillars(dungeon)
@@ -204,9 +182,7 @@ class DungeonFactory(ABC):
         # Finally add other items
         self.place_items(dungeon)
 
-        # Print final layout and verify connections
-        self.print_dungeon_layout(dungeon)
-        self.verify_door_connections(dungeon)
+        return dungeon
 
     def place_pillars(self, dungeon: Dungeon) -> None:
         """
@@ -226,7 +202,7 @@ class DungeonFactory(ABC):
                           if (x, y) != dungeon.entrance and (x, y) != dungeon.exit]
 
         pillar_rooms = []
-        pillars = list(Room.PILLARS)
+        pillars = sorted(Room.PILLARS)  # Stable order; PILLARS is a frozenset
         random.shuffle(available_rooms)  # Randomize placement
 
         for i, pillar in enumerate(pillars):
@@ -238,7 +214,6 @@ class DungeonFactory(ABC):
                     dungeon.maze[y][x].hasPillar = True
                     dungeon.maze[y][x].pillarType = pillar
                     dungeon.pillar_locations.append((pillar, x, y))  # Track pillar location
-                    print(f"Placed pillar {pillar} at ({x}, {y})")
                 else:
                     print(f"Warning: Room ({x}, {y}) not reachable for pillar {pillar}")
 
@@ -254,12 +229,11 @@ class DungeonFactory(ABC):
         Args:
             dungeon (Dungeon): The dungeon to populate with monsters
         """
-        monsters = self._monster_factory.create_monster()
-        for y in range(dungeon.size[1]):
-            for x in range(dungeon.size[0]):
-                room = dungeon.get_room(x, y)
-                if not (room.isEntrance or room.isExit or room.hasPillar):
-                    room.spawn_monster()  # 30% chance by default
+        maze = dungeon.maze
+        for y, x in product(range(dungeon.size[1]), range(dungeon.size[0])):
+            room = maze[y][x]
+            if not (room.isEntrance or room.isExit or room.hasPillar):
+                room.spawn_monster()  # 30% chance by default
 
     def place_items(self, dungeon: Dungeon) -> None:
         """
@@ -278,16 +252,18 @@ class DungeonFactory(ABC):
         Args:
             dungeon (Dungeon): The dungeon to distribute items in
         """
-        for y in range(dungeon.size[1]):
-            for x in range(dungeon.size[0]):
-                room = dungeon.get_room(x, y)
-                if (x, y) not in [dungeon.entrance, dungeon.exit] and not room.hasPillar:
-                    if random.random() < 0.1:
-                        room.hasHealthPot = True
-                    if random.random() < 0.1:
-                        room.hasVisionPot = True
-                    if random.random() < 0.1:
-                        room.hasPit = True
+        width, height = dungeon.size
+        excluded = (dungeon.entrance, dungeon.exit)
+
+        # Draw three rolls per room for the whole grid up front
+        rnd = random.random
+        rolls = [rnd() for _ in range(3 * width * height)]
+
+        for y in range(height):
+            for x in range(width):
+                room = dungeon.maze[y][x]
+                if (x, y) not in excluded and not room.hasPillar:
+                    room.populate_from_rolls(rolls, 3 * (y * width + x))
 
     def add_additional_connections(self, dungeon: Dungeon) -> None:
         """Add more connections to ensure pillar reachability."""
@@ -1,7 +1,122 @@
+import functools
 import random
 from .dungeon import Dungeon
 from .dungeon_factory import DungeonFactory
-from .room import Room
+from .room import Room, DOOR_BITS
+
+_N, _S, _E, _W = DOOR_BITS['N'], DOOR_BITS['S'], DOOR_BITS['E'], DOOR_BITS['W']
+
+
+@functools.lru_cache(maxsize=None)
+def _grid_edges(width: int, height: int) -> tuple:
+    """
+    List every east and south connection of a grid, resolved to flat indices.
+
+    Built once per grid shape (in practice only the default 8x8), so the
+    carving loops iterate a ready-made table instead of recomputing bounds
+    and neighbor indices for every room.
+
+    Args:
+        width (int): Number of rooms per row
+        height (int): Number of rows
+
+    Returns:
+        tuple: (roll index, room, neighbor, room door bit, neighbor door bit)
+               entries in row-major order, east edge before south edge
+    """
+    edges = []
+    for y in range(height):
+        for x in range(width):
+            i = y * width + x
+            if x < width - 1:
+                edges.append((2 * i, i, i + 1, _E, _W))
+            if y < height - 1:
+                edges.append((2 * i + 1, i, i + width, _S, _N))
+    return tuple(edges)
+
+
+def _masks_reachable(masks: bytearray, width: int, start: int, target: int) -> bool:
+    """
+    Check whether target can be reached from start over a door bitmask grid.
+
+    Cells are flat indices (y * width + x) into masks. Doors never lead
+    off the grid, so following a door bit needs no bounds check.
+
+    Args:
+        masks (bytearray): Door bitmask per room, row by row
+        width (int): Number of rooms per row
+        start (int): Flat index of the starting room
+        target (int): Flat index of the destination room
+
+    Returns:
+        bool: True if a path exists, False otherwise
+    """
+    seen = bytearray(len(masks))
+    seen[start] = 1
+    stack = [start]
+
+    while stack:
+        i = stack.pop()
+        if i == target:
+            return True
+        mask = masks[i]
+        if mask & _N and not seen[i - width]:
+            seen[i - width] = 1
+            stack.append(i - width)
+        if mask & _S and not seen[i + width]:
+            seen[i + width] = 1
+            stack.append(i + width)
+        if mask & _E and not seen[i + 1]:
+            seen[i + 1] = 1
+            stack.append(i + 1)
+        if mask & _W and not seen[i - 1]:
+            seen[i - 1] = 1
+            stack.append(i - 1)
+
+    return False
+
+
+def _carve_critical_path(masks: bytearray, width: int, start, target) -> None:
+    """
+    Open doors along a walk from start to target, horizontal steps first.
+
+    Works on the flat door bitmask buffer, so each step costs only the
+    two bit-ors joining the rooms.
+
+    Args:
+        masks (bytearray): Door bitmask per room, row by row
+        width (int): Number of rooms per row
+        start (Tuple[int, int]): Coordinates the walk begins at
+        target (Tuple[int, int]): Coordinates the walk ends at
+    """
+    x, y = start
+    target_x, target_y = target
+    i = y * width + x
+
+    # Move horizontally first
+    while x < target_x:
+        masks[i] |= _E
+        masks[i + 1] |= _W
+        x += 1
+        i += 1
+    while x > target_x:
+        masks[i] |= _W
+        masks[i - 1] |= _E
+        x -= 1
+        i -= 1
+
+    # Then move vertically
+    while y < target_y:
+        masks[i] |= _S
+        masks[i + width] |= _N
+        y += 1
+        i += width
+    while y > target_y:
+        masks[i] |= _N
+        masks[i - width] |= _S
+        y -= 1
+        i -= width
+
 
 class EasyDungeonFactory(DungeonFactory):
     """
@@ -55,7 +170,7 @@ class EasyDungeonFactory(DungeonFactory):
         self.generate_maze_easy()
         self.ensure_critical_path()
         self.validate_connections()
-        self.populate_rooms(self.dungeon)  # This will also print layout
+        self.populate_rooms(self.dungeon)
         return self.dungeon
 
     def initialize_maze(self) -> None:
@@ -72,18 +187,15 @@ class EasyDungeonFactory(DungeonFactory):
         dungeon generation algorithm, providing a consistent
         starting point for maze creation.
         """
-        self.dungeon.maze = []
-        for y in range(self.dungeon.size[1]):
-            row = []
-            for x in range(self.dungeon.size[0]):
-                row.append(Room())
-            self.dungeon.maze.append(row)
+        dungeon = self.dungeon
+        width, height = dungeon.size
+        maze = dungeon.maze = [[Room() for _ in range(width)] for _ in range(height)]
 
         # Set entrance and exit
-        self.dungeon.entrance = (0, 0)
-        self.dungeon.exit = (self.dungeon.size[0] - 1, self.dungeon.size[1] - 1)
-        self.dungeon.maze[0][0].isEntrance = True
-        self.dungeon.maze[self.dungeon.size[1] - 1][self.dungeon.size[0] - 1].isExit = True
+        dungeon.entrance = (0, 0)
+        dungeon.exit = (width - 1, height - 1)
+        maze[0][0].isEntrance = True
+        maze[height - 1][width - 1].isExit = True
 
     def generate_maze_easy(self) -> None:
         """
@@ -109,30 +221,33 @@ class EasyDungeonFactory(DungeonFactory):
         The approach creates a more predictable but still
         interesting dungeon layout.
         """
+        # The carving works on a flat byte-per-room door buffer and is
+        # written back to the Room grid once at the end.
+        width, height = self.dungeon.size
+        masks = self.dungeon.door_masks()
+        edges = _grid_edges(width, height)
+
         # First create a grid where every room connects to adjacent rooms
-        for y in range(self.dungeon.size[1]):
-            for x in range(self.dungeon.size[0]):
-                # Connect to room to the east
-                if x < self.dungeon.size[0] - 1:
-                    self.ensure_bidirectional_connection(self.dungeon, x, y, x + 1, y, 'E', 'W')
-                # Connect to room to the south
-                if y < self.dungeon.size[1] - 1:
-                    self.ensure_bidirectional_connection(self.dungeon, x, y, x, y + 1, 'S', 'N')
-
-        # Then randomly remove some connections while ensuring reachability
-        for y in range(self.dungeon.size[1]):
-            for x in range(self.dungeon.size[0]):
-                # Try to remove east connections
-                if x < self.dungeon.size[0] - 1 and random.random() < 0.3:
-                    self.remove_connection(self.dungeon, x, y, x + 1, y, 'E', 'W')
-                    if not self.dungeon.is_room_reachable(self.dungeon.entrance, self.dungeon.exit):
-                        self.ensure_bidirectional_connection(self.dungeon, x, y, x + 1, y, 'E', 'W')
-
-                # Try to remove south connections
-                if y < self.dungeon.size[1] - 1 and random.random() < 0.3:
-                    self.remove_connection(self.dungeon, x, y, x, y + 1, 'S', 'N')
-                    if not self.dungeon.is_room_reachable(self.dungeon.entrance, self.dungeon.exit):
-                        self.ensure_bidirectional_connection(self.dungeon, x, y, x, y + 1, 'S', 'N')
+        for _, room, neighbor, door, back_door in edges:
+            masks[room] |= door
+            masks[neighbor] |= back_door
+
+        # Then randomly remove some connections while ensuring reachability.
+        # Two rolls per room (east, south) are drawn for the whole grid at once.
+        rnd = random.random
+        rolls = [rnd() for _ in range(2 * width * height)]
+        start = self.dungeon.entrance[1] * width + self.dungeon.entrance[0]
+        target = self.dungeon.exit[1] * width + self.dungeon.exit[0]
+
+        for roll, room, neighbor, door, back_door in edges:
+            if rolls[roll] < 0.3:
+                masks[room] &= ~door
+                masks[neighbor] &= ~back_door
+                if not _masks_reachable(masks, width, start, target):
+                    masks[room] |= door
+                    masks[neighbor] |= back_door
+
+        self.dungeon.apply_door_masks(masks)
 
     def ensure_critical_path(self) -> None:
         """
@@ -156,30 +271,9 @@ class EasyDungeonFactory(DungeonFactory):
         3. Create connections in each movement step
         """
         # Create a path from entrance to exit
-        current_x, current_y = self.dungeon.entrance
-        target_x, target_y = self.dungeon.exit
-
-        while current_x != target_x or current_y != target_y:
-            current_room = self.dungeon.maze[current_y][current_x]
-
-            # Move horizontally first
-            if current_x < target_x:
-                self.ensure_bidirectional_connection(self.dungeon, current_x, current_y,
-                                                  current_x + 1, current_y, 'E', 'W')
-                current_x += 1
-            elif current_x > target_x:
-                self.ensure_bidirectional_connection(self.dungeon, current_x, current_y,
-                                                  current_x - 1, current_y, 'W', 'E')
-                current_x -= 1
-            # Then move vertically
-            elif current_y < target_y:
-                self.ensure_bidirectional_connection(self.dungeon, current_x, current_y,
-                                                  current_x, current_y + 1, 'S', 'N')
-                current_y += 1
-            elif current_y > target_y:
-                self.ensure_bidirectional_connection(self.dungeon, current_x, current_y,
-                                                  current_x, current_y - 1, 'N', 'S')
-                current_y -= 1
+        masks = self.dungeon.door_masks()
+        _carve_critical_path(masks, self.dungeon.size[0], self.dungeon.entrance, self.dungeon.exit)
+        self.dungeon.apply_door_masks(masks)
 
     def validate_connections(self) -> None:
         """
@@ -200,23 +294,16 @@ class EasyDungeonFactory(DungeonFactory):
         prevents potential navigation issues and ensures a
         logically consistent dungeon structure.
         """
-        for y in range(self.dungeon.size[1]):
-            for x in range(self.dungeon.size[0]):
-                current_room = self.dungeon.maze[y][x]
-
-                # Check east connection
-                if x < self.dungeon.size[0] - 1:
-                    next_room = self.dungeon.maze[y][x + 1]
-                    if current_room.doors['E'] != next_room.doors['W']:
-                        # Fix inconsistency
-                        current_room.doors['E'] = False
-                        next_room.doors['W'] = False
-
-                # Check south connection
-                if y < self.dungeon.size[1] - 1:
-                    next_room = self.dungeon.maze[y + 1][x]
-                    if current_room.doors['S'] != next_room.doors['N']:
-                        # Fix inconsistency
-                        current_room.doors['S'] = False
-                        next_room.doors['N'] = False
-
+        width, height = self.dungeon.size
+        masks = self.dungeon.door_masks()
+        fixed = False
+
+        # Close both sides of any door that only one of the two rooms has
+        for _, room, neighbor, door, back_door in _grid_edges(width, height):
+            if (not masks[room] & door) != (not masks[neighbor] & back_door):
+                masks[room] &= ~door
+                masks[neighbor] &= ~back_door
+                fixed = True
+
+        if fixed:
+            self.dungeon.apply_door_masks(masks)
@@ -1,9 +1,105 @@
+import functools
 import random
-from typing import Optional, List
-from src.characters.monsters.ogre import Ogre
-from src.characters.monsters.gremlin import Gremlin
-from src.characters.monsters.skeleton import Skeleton
-from src.characters.base.monster import Monster
+import sys
+from typing import Optional, List, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.characters.base.monster import Monster
+
+
+@functools.lru_cache(maxsize=None)
+def _monster_specs() -> tuple:
+    """
+    Monster types and their stats for randomly spawned room monsters.
+
+    The monster modules are imported on the first spawn rather than with
+    this module, so code that only builds or renders dungeons never
+    loads them.
+
+    Returns:
+        tuple: (monster class, constructor kwargs) pairs
+    """
+    from src.characters.monsters.ogre import Ogre
+    from src.characters.monsters.gremlin import Gremlin
+    from src.characters.monsters.skeleton import Skeleton
+
+    # PLACEHOLDER HARD CODED VALUES FOR NOW
+    return (
+        (Ogre, {
+            'hp': 200,
+            'min_damage': 30,
+            'max_damage': 60,
+            'attack_speed': 2,
+            'hit_chance': 0.6,
+            'heal_chance': 0.1,
+            'min_heal': 30,
+            'max_heal': 60
+        }),
+        (Gremlin, {
+            'hp': 70,
+            'min_damage': 15,
+            'max_damage': 30,
+            'attack_speed': 5,
+            'hit_chance': 0.8,
+            'heal_chance': 0.4,
+            'min_heal': 20,
+            'max_heal': 40
+        }),
+        (Skeleton, {
+            'hp': 100,
+            'min_damage': 30,
+            'max_damage': 50,
+            'attack_speed': 3,
+            'hit_chance': 0.8,
+            'heal_chance': 0.3,
+            'min_heal': 30,
+            'max_heal': 50
+        }),
+    )
+
+
+# Bit assigned to each door direction in a room's door mask
+DOOR_BITS = {'N': 1, 'S': 2, 'E': 4, 'W': 8}
+
+
+def _build_frames():
+    """Build the (top, left, right, bottom) ASCII pieces for every door mask."""
+    frames = []
+    for mask in range(16):
+        frames.append((
+            ' * ' + ('-' if mask & DOOR_BITS['N'] else ' * ') + ' * ',
+            ' | ' if mask & DOOR_BITS['W'] else ' * ',
+            ' | ' if mask & DOOR_BITS['E'] else ' * ',
+            ' * ' + (' - ' if mask & DOOR_BITS['S'] else ' * ') + ' * ',
+        ))
+    return tuple(frames)
+
+# Bits of the packed Room._state byte that drives get_room_display
+_ENTRANCE_BIT = 1
+_EXIT_BIT = 2
+_PIT_BIT = 4
+_HEALTH_POT_BIT = 8
+_VISION_POT_BIT = 16
+_PILLAR_BIT = 32
+_MONSTER_BIT = 64
+# Not stored in _state: rooms don't know whether they have been seen (the
+# Dungeon tracks that), so callers add this bit when indexing the
+# display table for a seen room
+_SEEN_BIT = 128
+
+
+def _state_flag(bit: int, doc: str) -> property:
+    """Create a boolean property backed by one bit of Room._state."""
+    def getter(self) -> bool:
+        return bool(self._state & bit)
+
+    def setter(self, value: bool) -> None:
+        if value:
+            self._state |= bit
+        else:
+            self._state &= ~bit
+
+    return property(getter, setter, doc=doc)
 
 
 class Room:
@@ -30,7 +126,6 @@ class Room:
     Core Attributes Track:
     - Room contents (monsters, items, pillars)
     - Directional doors
-    - Visited status
     - Special room types
     """
 
@@ -44,8 +139,32 @@ class Room:
     MULTIPLE_ITEMS = 'M'
     MONSTER = 'E'  # E for Enemy
 
-    # Add Pillars list
-    PILLARS = ['A', 'E', 'I', 'P']  # The four Pillars of OO
+    # The four Pillars of OO (frozenset for O(1) membership checks).
+    # Interned so pillarType comparisons against these are identity checks.
+    PILLARS = frozenset(map(sys.intern, ('A', 'E', 'I', 'P')))
+
+    # Loot table shared by every room: (item, drop chance)
+    _LOOT = (
+        ('health_potion', 0.3),  # 30% chance
+        ('vision_potion', 0.2),  # 20% chance
+    )
+
+    # Chance of each item (health potion, vision potion, pit) when stocking a room
+    ITEM_CHANCE = 0.1
+
+    # ASCII frame pieces indexed by door mask, built once at import
+    _FRAMES = _build_frames()
+
+    # Fixed attribute layout; rooms are created W*H times per dungeon.
+    # The boolean flags are packed into _state, see the properties below.
+    __slots__ = ('_state', 'pillarType', 'doors', '_monster')
+
+    hasPit = _state_flag(_PIT_BIT, "Whether the room holds a pit trap.")
+    hasHealthPot = _state_flag(_HEALTH_POT_BIT, "Whether the room holds a health potion.")
+    hasVisionPot = _state_flag(_VISION_POT_BIT, "Whether the room holds a vision potion.")
+    hasPillar = _state_flag(_PILLAR_BIT, "Whether the room holds a pillar.")
+    isEntrance = _state_flag(_ENTRANCE_BIT, "Whether the room is the dungeon entrance.")
+    isExit = _state_flag(_EXIT_BIT, "Whether the room is the dungeon exit.")
 
     def __init__(self):
         """
@@ -54,33 +173,58 @@ class Room:
         Sets up the initial configuration for a room, including:
         - No items or monsters by default
         - Closed doors in all directions
-        - Unvisited status
         - Placeholder for potential special contents
 
         The constructor prepares a blank room state that can be
         dynamically populated during dungeon generation.
         """
-        self.hasPit = False
-        self.hasHealthPot = False
-        self.hasVisionPot = False
-        self.hasPillar = False
-        self.isEntrance = False
-        self.isExit = False
+        # All boolean flags (items, entrance/exit) start cleared
+        self._state = 0
         self.pillarType = None
         self.doors = {
             'N': False, 'S': False,
             'E': False, 'W': False
         }
-        self.visited = False
 
-        # Monster and loot attributes
-        self.monster: Optional[Monster] = None
-        self.loot_drops = {
-            'health_potion': 0.3,  # 30% chance
-            'vision_potion': 0.2  # 20% chance
-        }
+        # Monster attribute (loot chances live in the class-level _LOOT table)
+        self._monster: Optional['Monster'] = None
+
+    @property
+    def monster(self) -> Optional['Monster']:
+        """
+        Get the monster occupying the room.
+
+        Returns:
+            Optional[Monster]: The room's monster, or None
+        """
+        return self._monster
+
+    @monster.setter
+    def monster(self, monster: Optional['Monster']) -> None:
+        """
+        Set the room's monster and keep the packed state in sync.
+
+        Args:
+            monster (Optional[Monster]): Monster to place, or None to clear
+        """
+        self._monster = monster
+        if monster is not None:
+            self._state |= _MONSTER_BIT
+        else:
+            self._state &= ~_MONSTER_BIT
+
+    def door_mask(self) -> int:
+        """
+        Pack the room's open doors into a 4-bit mask.
 
-    def place_monster(self, monster: Monster):
+        Returns:
+            int: OR of the DOOR_BITS entries for every open door
+        """
+        doors = self.doors
+        return ((doors['N'] and 1) | (doors['S'] and 2) |
+                (doors['E'] and 4) | (doors['W'] and 8))
+
+    def place_monster(self, monster: 'Monster'):
         self.monster = monster
 
     def spawn_monster(self, force: bool = False) -> None:
@@ -105,49 +249,38 @@ class Room:
                 Defaults to False.
         """
         # Don't spawn in entrance/exit or if already has monster
-        if (self.isEntrance or self.isExit or self.monster) and not force:
+        if not force and (self.isEntrance or self.isExit or self.monster is not None):
             return
 
         # 30% chance to spawn monster (or 100% if forced)
         if force or random.random() < 0.3:
-            monster_types = [Ogre, Gremlin, Skeleton]
-            monster_class = random.choice(monster_types)
-
-            # Create monster with appropriate default values based on type
-            # PLACEHOLDER HARD CODED VALUES FOR NOW
-            if monster_class == Ogre:
-                self.monster = Ogre(
-                    hp=200,
-                    min_damage=30,
-                    max_damage=60,
-                    attack_speed=2,
-                    hit_chance=0.6,
-                    heal_chance=0.1,
-                    min_heal=30,
-                    max_heal=60
-                )
-            elif monster_class == Skeleton:
-                self.monster = Skeleton(
-                    hp=100,
-                    min_damage=30,
-                    max_damage=50,
-                    attack_speed=3,
-                    hit_chance=0.8,
-                    heal_chance=0.3,
-                    min_heal=30,
-                    max_heal=50
-                )
-            elif monster_class == Gremlin:
-                self.monster = Gremlin(
-                    hp=70,
-                    min_damage=15,
-                    max_damage=30,
-                    attack_speed=5,
-                    hit_chance=0.8,
-                    heal_chance=0.4,
-                    min_heal=20,
-                    max_heal=40
-                )
+            monster_class, stats = random.choice(_monster_specs())
+            self.monster = monster_class(**stats)
+
+    def populate_from_rolls(self, rolls: Sequence[float], start: int = 0) -> None:
+        """
+        Stock the room with items using pre-drawn random rolls.
+
+        Lets dungeon generation draw the rolls for the whole grid in one
+        pass instead of calling random.random() per item per room, and
+        keeps each room's contents tied to its own rolls.
+
+        Args:
+            rolls (Sequence[float]):
+                Floats in [0, 1); the three from start on are the health
+                potion, vision potion and pit checks, in that order
+            start (int): Index of this room's first roll, so the whole
+                         grid's rolls can be passed without slicing
+        """
+        health_roll = rolls[start]
+        vision_roll = rolls[start + 1]
+        pit_roll = rolls[start + 2]
+        if health_roll < self.ITEM_CHANCE:
+            self.hasHealthPot = True
+        if vision_roll < self.ITEM_CHANCE:
+            self.hasVisionPot = True
+        if pit_roll < self.ITEM_CHANCE:
+            self.hasPit = True
 
     def get_drops(self) -> List[str]:
         """
@@ -164,11 +297,8 @@ class Room:
         Returns:
             List[str]: Items that were successfully dropped
         """
-        drops = []
-        for item, chance in self.loot_drops.items():
-            if random.random() < chance:
-                drops.append(item)
-        return drops
+        rnd = random.random
+        return [item for item, chance in self._LOOT if rnd() < chance]
 
     def clear_monster(self) -> List[str]:
         """
@@ -188,7 +318,7 @@ class Room:
             return drops
         return []
 
-    def get_room_display(self) -> str:
+    def get_room_display(self, visited: bool = False) -> str:
         """
         Generate a single-character representation of room contents.
 
@@ -206,34 +336,29 @@ class Room:
         4. Specific item types
         5. Default empty state
 
+        The priority rules are precomputed for every packed state in
+        _display_table(); a None entry means the lone item is a pillar.
+
+        Args:
+            visited (bool): Whether the hero has seen the room; monsters
+                            only show in seen rooms
+
         Returns:
             str: Single-character room state representation
         """
-        if self.isEntrance:
-            return self.ENTRANCE
-        if self.isExit:
-            return self.EXIT
-        if self.monster and self.visited:
-            return self.MONSTER
-
-        # Count visible items
-        items = sum([self.hasPit, self.hasHealthPot,
-                     self.hasVisionPot, self.hasPillar])
-
-        if items > 1:
-            return self.MULTIPLE_ITEMS
-        elif self.hasPit:
-            return self.PIT
-        elif self.hasHealthPot:
-            return self.HEALTH_POT
-        elif self.hasVisionPot:
-            return self.VISION_POT
-        elif self.hasPillar:
-            return self.pillarType
-        else:
-            return self.EMPTY
+        display = _display_table()[(self._state | _SEEN_BIT) if visited else self._state]
+        return self.pillarType if display is None else display
 
     def __str__(self) -> str:
+        """
+        Create an ASCII art representation of the room, as yet unseen.
+
+        Returns:
+            str: Multi-line ASCII art room representation
+        """
+        return self.ascii_art(False)
+
+    def ascii_art(self, visited: bool) -> str:
         """
         Create an ASCII art representation of the room.
 
@@ -247,12 +372,49 @@ class Room:
         - Middle section with room contents
         - Bottom border with door status
 
+        Args:
+            visited (bool): Whether the hero has seen the room; unseen
+                            rooms hide their contents
+
         Returns:
             str: Multi-line ASCII art room representation
         """
-        top = ' * ' + ('-' if self.doors['N'] else ' * ') + ' * '
-        mid = (' | ' if self.doors['W'] else ' * ') + \
-              (self.get_room_display() + ' ' if self.visited else ' ? ') + \
-              (' | ' if self.doors['E'] else ' * ')
-        bot = ' * ' + (' - ' if self.doors['S'] else ' * ') + ' * '
-        return top + '\n' + mid + '\n' + bot
\ No newline at end of file
+        top, left, right, bot = self._FRAMES[self.door_mask()]
+        content = self.get_room_display(True) + ' ' if visited else ' ? '
+        return f"{top}\n{left}{content}{right}\n{bot}"
+
+
+@functools.lru_cache(maxsize=None)
+def _display_table() -> tuple:
+    """
+    Precompute get_room_display's result for every packed room state.
+
+    Built on the first lookup, once the Room display characters exist.
+
+    Returns:
+        tuple: Display character (or None for a pillar) per state
+    """
+    table = []
+    for state in range(256):
+        items = sum(1 for bit in (_PIT_BIT, _HEALTH_POT_BIT, _VISION_POT_BIT, _PILLAR_BIT)
+                    if state & bit)
+        if state & _ENTRANCE_BIT:
+            display = Room.ENTRANCE
+        elif state & _EXIT_BIT:
+            display = Room.EXIT
+        elif state & _MONSTER_BIT and state & _SEEN_BIT:
+            display = Room.MONSTER
+        elif items > 1:
+            display = Room.MULTIPLE_ITEMS
+        elif state & _PIT_BIT:
+            display = Room.PIT
+        elif state & _HEALTH_POT_BIT:
+            display = Room.HEALTH_POT
+        elif state & _VISION_POT_BIT:
+            display = Room.VISION_POT
+        elif state & _PILLAR_BIT:
+            display = None  # Resolved to the room's pillarType
+        else:
+            display = Room.EMPTY
+        table.append(display)
+    return tuple(table)
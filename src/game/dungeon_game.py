@@ -4,13 +4,34 @@ from src.characters.heroes.priestess import Priestess
 from src.characters.heroes.thief import Thief
 from src.characters.heroes.warrior import Warrior
 from src.database.sqlite_dungeon_configuration import SqliteDungeonConfiguration
-from src.database.sqlite_hero_configuration import SqliteHeroConfiguration
 from src.dungeon.dfs_factory import DFSDungeonFactory
 from src.dungeon.easy_factory import EasyDungeonFactory
 from src.game.game_state import GameState
 from src.gui import GameWindow
 from src.gui.start_menu.game_start_menu import GameMenu
 
+# Window and audio device chatter no game state reacts to (WINDOWEXPOSED
+# is kept: GameWindow repaints on it); SDL drops
+# these before they reach the queue. Everything else, including the
+# TEXTINPUT events pygame builds KEYDOWN.unicode from, gets through.
+NOISY_EVENTS = [pygame.ACTIVEEVENT, pygame.VIDEOEXPOSE,
+                pygame.AUDIODEVICEADDED, pygame.AUDIODEVICEREMOVED,
+                pygame.WINDOWSHOWN, pygame.WINDOWHIDDEN, pygame.WINDOWMOVED, pygame.WINDOWENTER, pygame.WINDOWLEAVE,
+                pygame.WINDOWFOCUSGAINED, pygame.WINDOWFOCUSLOST]
+
+FRAME_RATE = 60
+
+# Hero class and dungeon factory for each menu selection
+HERO_CLASSES = {
+    'Warrior': Warrior,
+    'Priestess': Priestess,
+    'Thief': Thief
+}
+DUNGEON_FACTORIES = {
+    'easy': EasyDungeonFactory,
+    'hard': DFSDungeonFactory
+}
+
 
 class DungeonGame:
     """
@@ -76,6 +97,7 @@ class DungeonGame:
         """
         self.move_cooldown = None
         self.last_move_time = None
+        self.now = 0  # pygame ticks at the start of the current frame
         self.hero = None
         self.dungeon = None
         self.game_window = None
@@ -90,6 +112,15 @@ class DungeonGame:
         pygame.init()
         self.screen = pygame.display.set_mode((1024, 768))
         pygame.display.set_caption("Dungeon Adventure")
+
+        # Per-frame handler for each game state, looked up once per frame by run()
+        self._state_handlers = {
+            GameState.MENU: self.handle_menu,
+            GameState.PLAYING: self.handle_playing,
+            GameState.GAME_OVER: self.handle_game_over,
+            GameState.VICTORY: self.handle_victory,
+        }
+        self.menu = GameMenu(self.screen, self.save_data)
         self.reset_game()
 
     def reset_game(self):
@@ -103,21 +134,37 @@ class DungeonGame:
 
         Reset Process:
         1. Set game state to menu
-        2. Clear existing game objects
+        2. Clear existing game objects and menu selections
         3. Reset time-based mechanics
         4. Prepare for new game configuration
         """
         self.state = GameState.MENU
-        self.menu = GameMenu(self.screen, self.save_data)
+        self.menu.reset(self.save_data)
         self.game_window = None
         self.dungeon = None
         self.hero = None
         self.last_move_time = 0
         self.move_cooldown = 200
 
-    def handle_game_over(self):
+    def update_event_filter(self):
+        """
+        Keep noisy event types the current state ignores out of the queue.
+
+        Window and audio device events are always blocked. Mouse motion
+        is only let through on the menu, which uses it for button hover;
+        during play it is blocked too, so the high-frequency motion
+        events are never queued or turned into Python event objects.
+        Only these types are blocked: text input has to stay allowed for
+        the name field on the menu to receive typed characters.
+        """
+        pygame.event.set_allowed(None)
+        pygame.event.set_blocked(NOISY_EVENTS)
+        if self.state != GameState.MENU:
+            pygame.event.set_blocked(pygame.MOUSEMOTION)
+
+    def handle_game_over(self, events):
         """Handle game over state and check for restart"""
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
             if event.type == pygame.KEYDOWN:
@@ -132,6 +179,22 @@ class DungeonGame:
             self.game_window.draw_game_over()
         return True
 
+    def handle_victory(self, events):
+        """Keep showing the victory screen until the player restarts or quits"""
+        for event in events:
+            if event.type == pygame.QUIT:
+                return False
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_r:  # Restart
+                    self.reset_game()
+                    return True
+                elif event.key == pygame.K_ESCAPE:  # Quit
+                    return False
+
+        if self.game_window:
+            self.game_window.draw(self.hero)
+        return True
+
     def init_game(self, settings):
         """
         Initialize a new game based on player configuration.
@@ -154,18 +217,11 @@ class DungeonGame:
         - Enables dynamic game initialization
         """
         self.dungeon_config.clear_db()
-        factory_class = EasyDungeonFactory if settings['difficulty'] == 'easy' else DFSDungeonFactory
-        factory = factory_class()
+        factory = DUNGEON_FACTORIES.get(settings['difficulty'], DFSDungeonFactory)()
         self.dungeon = factory.create()
 
         # Create hero based on class selection
-        hero_class = {
-            'Warrior': Warrior,
-            'Priestess': Priestess,
-            'Thief': Thief
-        }[settings['hero_class']]
-
-        self.hero = hero_class(settings['player_name'])
+        self.hero = HERO_CLASSES[settings['hero_class']](settings['player_name'])
         self.hero.location = self.dungeon.entrance
 
         # Initialize game window with hero reference
@@ -179,9 +235,6 @@ class DungeonGame:
         self.dungeon = self.save_data.dungeon
         self.hero = self.save_data.hero
 
-        print(self.save_data.hero.location)
-        print(self.save_data.dungeon)
-
         # Initialize game window with hero reference
         self.game_window = GameWindow(self.dungeon, self.dungeon.pillar_locations, self.hero)
         self.game_window.event_log.add_message(f"Welcome, {self.hero.name}!")
@@ -189,7 +242,7 @@ class DungeonGame:
         # Set game state to playing
         self.state = GameState.PLAYING
 
-    def handle_menu(self):
+    def handle_menu(self, events):
         """
         Manage interactions within the game's start menu.
 
@@ -203,34 +256,34 @@ class DungeonGame:
         2. Handle menu interactions
         3. Check for game start conditions
         4. Render menu interface
+
+        Args:
+            events: This frame's pygame events, polled once by run()
         """
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
 
-            self.menu.handle_event(event)
-
-            # Check if menu is complete and game should start
-            settings = self.menu.get_game_settings()
+            # The menu returns settings once start or load is clicked
+            settings = self.menu.handle_event(event)
             if settings:
-                print(settings)
                 if settings["hero_class"] == "load":
                     self.load_game()
                 else:
                     self.init_game(settings)
+                break
 
         self.menu.draw()
         return True
 
     def can_move(self) -> bool:
-        """Check if enough time has passed to allow movement."""
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_move_time >= self.move_cooldown:
-            self.last_move_time = current_time
+        """Check if enough time has passed to allow movement, as of this frame."""
+        if self.now - self.last_move_time >= self.move_cooldown:
+            self.last_move_time = self.now
             return True
         return False
 
-    def handle_playing(self):
+    def handle_playing(self, events):
         """
         Manage active gameplay interactions and state.
 
@@ -246,8 +299,11 @@ class DungeonGame:
         3. Manage item usage
         4. Check game-ending conditions
         5. Update game window
+
+        Args:
+            events: This frame's pygame events, polled once by run()
         """
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
             if not self.game_window.handle_event(event):
@@ -255,9 +311,12 @@ class DungeonGame:
                     self.state = GameState.GAME_OVER
                     return True
 
+        # Item usage (H/V) is one-shot per key press and is handled on
+        # KEYDOWN by GameWindow.handle_event in the event loop above;
+        # only movement auto-repeats from the held keyboard state
         if not self.game_window.in_combat:
-            keys = pygame.key.get_pressed()
             if self.can_move():
+                keys = pygame.key.get_pressed()
                 direction = None
                 if keys[pygame.K_w] or keys[pygame.K_UP]:
                     direction = 'N'
@@ -279,19 +338,7 @@ class DungeonGame:
                                 self.game_window.event_log.add_message(msg)
                     elif messages:
                         for msg in messages:
-                            self.game_window.event_log.add_message(msg, True)
-
-            # Handle item usage
-            if keys[pygame.K_h]:  # Health potion
-                if self.hero.use_healing_potion():
-                    self.game_window.event_log.add_message("Used a healing potion!")
-                else:
-                    self.game_window.event_log.add_message("No healing potions!", True)
-            elif keys[pygame.K_v]:  # Vision potion
-                if self.hero.use_vision_potion():
-                    self.game_window.event_log.add_message("Used a vision potion!")
-                else:
-                    self.game_window.event_log.add_message("No vision potions!", True)
+                            self.game_window.event_log.add_message(msg, "movement", True)
 
         # Update game state based on conditions
         if not self.hero.is_alive:
@@ -318,33 +365,28 @@ class DungeonGame:
         - State-based execution
         - Consistent frame rate management
         - Graceful game termination
+
+        The event queue is drained exactly once per frame and the batch
+        is handed to whichever state handler is active. Each frame first
+        sleeps until its deadline and only then polls input, so keys
+        pressed during the wait are handled by the frame that follows it
+        rather than one frame later.
         """
         running = True
         clock = pygame.time.Clock()
+        filtered_state = None
 
         while running:
-            if self.state == GameState.MENU:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        running = False
-                        break
-
-                    settings = self.menu.handle_event(event)
-                    if settings:
-                        if settings["hero_class"] == "load":
-                            self.load_game()
-                        else:
-                            self.init_game(settings)
-                        break
-
-                self.menu.draw()
-
-            elif self.state == GameState.PLAYING:
-                running = self.handle_playing()
+            # Clock.tick sleeps (it does not spin) for the rest of the frame
+            clock.tick(FRAME_RATE)
+            # One clock read per frame; timing checks use self.now
+            self.now = pygame.time.get_ticks()
 
-            elif self.state == GameState.GAME_OVER:
-                running = self.handle_game_over()
+            if self.state != filtered_state:
+                self.update_event_filter()
+                filtered_state = self.state
 
-            clock.tick(60)
+            events = pygame.event.get()
+            running = self._state_handlers[self.state](events)
 
         pygame.quit()
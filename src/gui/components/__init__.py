@@ -1,4 +1,5 @@
 from .event_log import EventLog
 from .stats_display import StatsDisplay
 from .minimap import MiniMap
-from .combat_ui import CombatUI
\ No newline at end of file
+from .combat_ui import CombatUI
+from .first_person_view import FirstPersonView
\ No newline at end of file
@@ -1,5 +1,10 @@
+from collections import OrderedDict, deque
+from itertools import islice
+
 import pygame
-from ..constants import WHITE, WINDOW_WIDTH, WINDOW_HEIGHT, BLACK
+from ..constants import WHITE, WINDOW_WIDTH, WINDOW_HEIGHT
+from .fonts import ACTION_MAN, get_font
+from .surfaces import to_display_format
 
 
 class CombatUI:
@@ -49,13 +54,11 @@ class CombatUI:
         3. Ensure consistent text rendering across different systems
         """
         # Initialize fonts
-        try:
-            self.font = pygame.font.Font("src/assets/fonts/ActionMan.ttf", 24)
-            self.title_font = pygame.font.Font("src/assets/fonts/ActionMan.ttf", 32)
-        except FileNotFoundError:
-            print("Could not load Action Man font, falling back to system default")
-            self.font = pygame.font.SysFont("arial", 24)
-            self.title_font = pygame.font.SysFont("arial", 32, bold=True)
+        self.font = get_font(ACTION_MAN, 24)
+
+        # Every portrait shares the same white 2px frame; fill it in once
+        self._portrait_template = pygame.Surface((64, 64))
+        self._portrait_template.fill(WHITE)
 
         # Simple placeholder portraits (64x64 colored rectangles for now)
         self.portraits = {
@@ -74,9 +77,224 @@ class CombatUI:
             'run': pygame.Rect(0, 0, 200, 50)
         }
 
-        # Combat log
-        self.combat_messages = []
+        # Static backdrop (background fill and empty combat log frame),
+        # composited on the first draw in the screen's pixel format
+        self._log_rect = pygame.Rect(WINDOW_WIDTH // 4, 50, WINDOW_WIDTH // 2, 100)
+        self._bg_surface = None
+
+        # Backdrop plus the current fighters' portraits and names, rebuilt
+        # only when a different pair of fighters meets
+        self._fight_bg = None
+        self._fight_key = None
+
+        # The empty health bar and its border never change, so draw them
+        # once; only the fill (and the rects locating it) vary per bar
+        self._hp_bar_bg = pygame.Surface((200, 20))
+        self._hp_bar_bg.fill((64, 0, 0))
+        pygame.draw.rect(self._hp_bar_bg, WHITE, self._hp_bar_bg.get_rect(), 2)
+        self._hp_bar_bg = to_display_format(self._hp_bar_bg)
+        self._hp_bar_fill = pygame.Rect(0, 0, 0, 20)
+        self._hp_bar_inner = self._hp_bar_bg.get_rect().inflate(-4, -4)
+
+        # Buttons never move, so lay them out once
+        button_x = WINDOW_WIDTH // 2 - 100  # Center buttons
+        button_start_y = 400
+        button_spacing = 60
+        for i, rect in enumerate(self.action_buttons.values()):
+            rect.topleft = (button_x, button_start_y + i * button_spacing)
+
+        # Buttons only ever look selected or unselected, so bake both
+        # versions (fill, border and label) once; kept as flat
+        # (action, rect, selected, unselected) records for the draw loop
+        self._buttons = tuple(
+            (action, rect,
+             self._create_button(action, (100, 100, 255), rect.size),
+             self._create_button(action, (64, 64, 64), rect.size))
+            for action, rect in self.action_buttons.items()
+        )
+
+        # The potion count sits just right of the potion button
+        potion_rect = self.action_buttons['potion']
+        self._potion_count_pos = (potion_rect.right + 10, potion_rect.centery - 10)
+
+        # Fixed positions of each fighter's name, portrait, health bar and HP text
+        self._fighter_layouts = {
+            side: {'name': (x, 170), 'portrait': (x, 200), 'bar': (x, 280), 'hp': (x, 300)}
+            for side, x in (('hero', 50), ('monster', 686))
+        }
+
+        # Screen regions repainted independently when their contents change:
+        # each fighter's health bar and HP text, the log (running to the
+        # window edge so long messages are cleared too), the potion count
+        # and every action button
+        text_height = self.font.get_height()
+        self._regions = {
+            side: pygame.Rect(layout['bar'], (250, layout['hp'][1] - layout['bar'][1] + text_height))
+            for side, layout in self._fighter_layouts.items()
+        }
+        self._regions['log'] = pygame.Rect(self._log_rect.left, self._log_rect.top,
+                                           WINDOW_WIDTH - self._log_rect.left, self._log_rect.height)
+        self._regions['potions'] = pygame.Rect(self._potion_count_pos, (80, text_height))
+        self._regions.update(self.action_buttons)
+        self._button_states = {action: (selected, unselected)
+                               for action, _, selected, unselected in self._buttons}
+
+        # What each region showed when last drawn; None forces a full repaint
+        self._drawn_state = None
+        # Past this share of the screen, one full-window update is cheaper
+        # than many small ones
+        self.full_update_ratio = 0.6
+        self._screen_area = WINDOW_WIDTH * WINDOW_HEIGHT
+
+        # Rendered text surfaces keyed by (text, color), least recently used first.
+        # Sized to hold a whole fight's worth of log lines.
+        self._text_cache = OrderedDict()
+        self.max_cached_texts = 128
+
+        # HP labels keyed by (hp, max_hp), so a repaint neither formats nor
+        # rasterizes the string and log lines cannot evict them mid-fight
+        self._hp_label_cache = {}
+
+        # Fighter name labels keyed by (name, class_name); class_name is
+        # None for monsters, which are labelled by name alone
+        self._name_label_cache = {}
+
+        # Combat log; the deque drops the oldest message once full
         self.max_combat_messages = 5
+        self.combat_messages = deque(maxlen=self.max_combat_messages)
+        self.visible_combat_messages = 4
+        # Snapshot of the messages shown in the log frame, refreshed only
+        # when the log changes so drawing never builds a new sequence
+        self._visible_messages = ()
+
+    def _get_background(self, screen):
+        """
+        Get the pre-composited static combat backdrop.
+
+        The background fill and the combat log frame never change, so
+        they are painted into one surface the first time the combat
+        screen is drawn and blitted in a single call afterwards.
+
+        Args:
+            screen: Pygame display surface the backdrop will be drawn on
+
+        Returns:
+            pygame.Surface: Full-window backdrop in the screen's pixel format
+        """
+        if self._bg_surface is None:
+            background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert(screen)
+            background.fill((20, 20, 20))
+            background.fill((40, 40, 40), self._log_rect)
+            pygame.draw.rect(background, WHITE, self._log_rect, 2)
+            self._bg_surface = background
+        return self._bg_surface
+
+    def _get_fight_background(self, screen, hero, monster):
+        """
+        Get the backdrop for the current fight.
+
+        Portraits and name labels only change when a new fight starts, so
+        they are composited onto the static backdrop once per pairing of
+        fighters; repainting a fighter panel then restores them for free.
+
+        Args:
+            screen: Pygame display surface the backdrop will be drawn on
+            hero: Player character
+            monster: Opponent character
+
+        Returns:
+            pygame.Surface: Full-window backdrop with both fighters' portraits
+                            and names
+        """
+        key = (hero.portrait_key, hero.name, hero.class_name, monster.portrait_key, monster.name)
+        if key != self._fight_key:
+            background = self._get_background(screen)
+            if self._fight_bg is None:
+                self._fight_bg = background.copy()
+            else:
+                self._fight_bg.blit(background, (0, 0))
+
+            fighters = (
+                (hero, self._fighter_layouts['hero'], self._name_label(hero.name, hero.class_name)),
+                (monster, self._fighter_layouts['monster'], self._name_label(monster.name)),
+            )
+            for character, layout, label in fighters:
+                portrait = self._get_character_portrait(character)
+                if portrait:
+                    self._fight_bg.blit(portrait, layout['portrait'])
+                self._fight_bg.blit(label, layout['name'])
+            self._fight_key = key
+            # Portraits and names are only restored by a full repaint
+            self._drawn_state = None
+        return self._fight_bg
+
+    def _render(self, text, color=WHITE):
+        """
+        Render text with the UI font, reusing earlier surfaces.
+
+        Log lines and the potion count stay the same for many frames in
+        a row, so each distinct (text, color) pair is rasterized once and
+        kept until it falls out of the least-recently-used cache.
+
+        Args:
+            text (str): Text to render
+            color: RGB tuple for the text
+
+        Returns:
+            pygame.Surface: The rendered text
+        """
+        key = (text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = to_display_format(self.font.render(text, True, color), alpha=True)
+            self._text_cache[key] = surface
+            if len(self._text_cache) > self.max_cached_texts:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surface
+
+    def _hp_label(self, hp, max_hp):
+        """
+        Get the rendered "HP: current/max" label for a health value.
+
+        Args:
+            hp (int): Current health points
+            max_hp (int): Maximum health points
+
+        Returns:
+            pygame.Surface: The rendered label
+        """
+        key = (hp, max_hp)
+        surface = self._hp_label_cache.get(key)
+        if surface is None:
+            if len(self._hp_label_cache) >= self.max_cached_texts:
+                self._hp_label_cache.clear()
+            surface = to_display_format(
+                self.font.render(f"HP: {hp}/{max_hp}", True, WHITE), alpha=True)
+            self._hp_label_cache[key] = surface
+        return surface
+
+    def _name_label(self, name, class_name=None):
+        """
+        Get the rendered name label shown above a fighter's portrait.
+
+        Args:
+            name (str): Character name
+            class_name (str, optional): Hero class, shown after the name
+
+        Returns:
+            pygame.Surface: The rendered label
+        """
+        key = (name, class_name)
+        surface = self._name_label_cache.get(key)
+        if surface is None:
+            if len(self._name_label_cache) >= self.max_cached_texts:
+                self._name_label_cache.clear()
+            text = f"{name} ({class_name})" if class_name else name
+            surface = to_display_format(self.font.render(text, True, WHITE), alpha=True)
+            self._name_label_cache[key] = surface
+        return surface
 
     def add_combat_message(self, message: str):
         """
@@ -95,10 +313,26 @@ class CombatUI:
         Args:
             message (str): Combat event description to be logged
         """
-        self.combat_messages.append(message)
-        # Keep only the most recent messages
-        if len(self.combat_messages) > self.max_combat_messages:
-            self.combat_messages.pop(0)
+        messages = self.combat_messages
+        messages.append(message)
+        self._visible_messages = tuple(
+            islice(messages, max(0, len(messages) - self.visible_combat_messages), None))
+
+    def clear_combat_messages(self):
+        """
+        Empty the combat log, ready for a new fight.
+        """
+        self.combat_messages.clear()
+        self._visible_messages = ()
+
+    def _recent_messages(self):
+        """
+        Get the combat messages that fit in the log frame.
+
+        Returns:
+            tuple: The newest messages, oldest first
+        """
+        return self._visible_messages
 
     def _create_portrait(self, color):
         """
@@ -106,8 +340,8 @@ class CombatUI:
 
         Creates visual representations for different character types
         using a basic color-based approach. This method:
-        - Generates a colored rectangular surface
-        - Adds a white border for visual distinction
+        - Copies a white-bordered template surface
+        - Fills the inside with the character's color
         - Provides a quick way to differentiate characters
 
         Design Considerations:
@@ -121,113 +355,185 @@ class CombatUI:
         Returns:
             pygame.Surface: A colored surface representing a character portrait
         """
-        surface = pygame.Surface((64, 64))
+        # Fill the inside of the pre-bordered template
+        surface = self._portrait_template.copy()
+        surface.fill(color, surface.get_rect().inflate(-4, -4))
+        return to_display_format(surface)
+
+    def _create_button(self, action, color, size):
+        """
+        Pre-render one state of an action button.
+
+        Args:
+            action: Action name, shown title-cased as the label
+            color: RGB fill color for this button state
+            size: (width, height) of the button
+
+        Returns:
+            pygame.Surface: The filled, bordered and labelled button
+        """
+        surface = pygame.Surface(size)
         surface.fill(color)
-        # Add a border
-        pygame.draw.rect(surface, (255, 255, 255), surface.get_rect(), 2)
-        return surface
+        pygame.draw.rect(surface, WHITE, surface.get_rect(), 2)
+        text = self.font.render(action.title(), True, WHITE)
+        surface.blit(text, text.get_rect(center=surface.get_rect().center))
+        return to_display_format(surface)
 
     def _get_character_portrait(self, character):
         """
         Get the appropriate portrait based on character class.
 
+        Heroes key their portrait by class name and monsters by their
+        type name, both set once as portrait_key when they are created.
+
         Args:
             character: The character (hero or monster) to get a portrait for
 
         Returns:
             A pygame Surface with the character's portrait
         """
-        # For heroes, use their class name
-        if hasattr(character, 'class_name'):
-            return self.portraits.get(character.class_name)
-        # For monsters, use their name
-        return self.portraits.get(character.__class__.__name__)
+        return self.portraits.get(character.portrait_key)
+
+    def invalidate(self):
+        """
+        Force the next draw_combat_screen call to repaint the whole screen.
+
+        Needed whenever something else has drawn over the combat screen,
+        such as a new combat starting after exploration.
+        """
+        self._drawn_state = None
 
     def draw_combat_screen(self, screen, hero, monster, selected_action=None):
         """
-        Render the complete combat interface.
+        Render the combat interface, repainting only what changed.
 
         This comprehensive method creates a full combat screen by:
-        1. Drawing combat background
-        2. Rendering character portraits
-        3. Displaying health bars
-        4. Showing character names and stats
-        5. Rendering combat log
-        6. Creating interactive action buttons
-
-        Visual Composition:
-        - Organized layout with clear information hierarchy
-        - Dynamic highlighting of selected actions
-        - Comprehensive combat state representation
+        1. Drawing the cached fight backdrop (background, log frame,
+           portraits and names)
+        2. Displaying health bars and HP values
+        3. Rendering combat log
+        4. Creating interactive action buttons
+
+        Dirty Region Tracking:
+        - The first frame (or one after invalidate() or a new pairing of
+          fighters) paints everything
+        - Later frames repaint a health bar, the log, the potion count or
+          a single button only when what it shows has changed
+        - Idle frames draw nothing at all
+        - If the changed regions cover most of the screen, a single
+          full-window rect is returned instead
 
         Args:
             screen: Pygame display surface
             hero: Player character
             monster: Opponent character
             selected_action: Currently selected combat action
+
+        Returns:
+            List[pygame.Rect]: Screen areas that were redrawn and need a
+                               display update (empty if nothing changed)
         """
-        # Draw combat background
-        pygame.draw.rect(screen, (20, 20, 20), pygame.Rect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT))
-
-        # Draw portraits
-        hero_portrait = self._get_character_portrait(hero)
-        monster_portrait = self._get_character_portrait(monster)
-
-        if hero_portrait:
-            screen.blit(hero_portrait, (50, 200))
-        if monster_portrait:
-            screen.blit(monster_portrait, (686, 200))
-
-        # Draw health bars
-        self._draw_health_bar(screen, (50, 280), hero.hp, hero._max_hp)
-        self._draw_health_bar(screen, (686, 280), monster.hp, monster._max_hp)
-
-        # Draw names and stats
-        hero_name = self.font.render(f"{hero.name} ({hero.class_name})", True, WHITE)
-        hero_hp = self.font.render(f"HP: {hero.hp}/{hero._max_hp}", True, WHITE)
-        screen.blit(hero_name, (50, 170))
-        screen.blit(hero_hp, (50, 300))
-
-        monster_name = self.font.render(f"{monster.name}", True, WHITE)
-        monster_hp = self.font.render(f"HP: {monster.hp}/{monster._max_hp}", True, WHITE)
-        screen.blit(monster_name, (686, 170))
-        screen.blit(monster_hp, (686, 300))
-
-        # Draw combat log
-        log_rect = pygame.Rect(WINDOW_WIDTH // 4, 50, WINDOW_WIDTH // 2, 100)
-        pygame.draw.rect(screen, (40, 40, 40), log_rect)
-        pygame.draw.rect(screen, WHITE, log_rect, 2)
-
-        # Show last few combat messages
-        y_offset = log_rect.top + 10
-        for msg in self.combat_messages[-4:]:
-            txt = self.font.render(msg, True, WHITE)
-            screen.blit(txt, (log_rect.left + 10, y_offset))
-            y_offset += 22
-
-        # Draw action buttons
-        button_x = WINDOW_WIDTH // 2 - 100  # Center buttons
-        button_start_y = 400
-        button_spacing = 60
+        background = self._get_fight_background(screen, hero, monster)
+        state = {
+            'hero': (hero.hp, hero._max_hp),
+            'monster': (monster.hp, monster._max_hp),
+            'log': self._recent_messages(),
+            'potions': hero.healing_potions,
+        }
+        for action in self.action_buttons:
+            state[action] = action == selected_action
+        previous = self._drawn_state
+        self._drawn_state = state
+
+        if previous is None:
+            # Draw the backdrop, log frame, portraits and names
+            screen.blit(background, (0, 0))
+            self._draw_fighter(screen, hero, self._fighter_layouts['hero'])
+            self._draw_fighter(screen, monster, self._fighter_layouts['monster'])
+            self._draw_log(screen)
+            self._draw_buttons(screen, hero, selected_action)
+            return [screen.get_rect()]
+
+        dirty_rects = []
+        dirty_area = 0
+        for region, value in state.items():
+            if value == previous[region]:
+                continue
+            area = self._regions[region]
+            screen.blit(background, area, area)
+            dirty_rects.append(area)
+            dirty_area += area.width * area.height
+
+            if region == 'hero':
+                self._draw_fighter(screen, hero, self._fighter_layouts['hero'])
+            elif region == 'monster':
+                self._draw_fighter(screen, monster, self._fighter_layouts['monster'])
+            elif region == 'log':
+                self._draw_log(screen)
+            elif region == 'potions':
+                self._draw_potion_count(screen, hero)
+            else:
+                selected, unselected = self._button_states[region]
+                screen.blit(selected if value else unselected, area)
+
+        if dirty_area > self.full_update_ratio * self._screen_area:
+            return [screen.get_rect()]
+        return dirty_rects
+
+    def _draw_fighter(self, screen, character, layout):
+        """
+        Draw one combatant's health bar and HP text.
+
+        The portrait and name are part of the fight backdrop, so only the
+        values that change during the fight are drawn here.
+
+        Args:
+            screen: Pygame display surface
+            character: The hero or monster to draw
+            layout: The combatant's precomputed positions from _fighter_layouts
+        """
+        self._draw_health_bar(screen, layout['bar'], character.hp, character._max_hp)
+        screen.blit(self._hp_label(character.hp, character._max_hp), layout['hp'])
+
+    def _draw_log(self, screen):
+        """
+        Draw the last few combat messages inside the log frame.
+
+        Args:
+            screen: Pygame display surface
+        """
+        log_rect = self._log_rect
+        x = log_rect.left + 10
+        top = log_rect.top + 10
+        screen.blits([(self._render(msg), (x, top + i * 22))
+                      for i, msg in enumerate(self._recent_messages())],
+                     doreturn=False)
+
+    def _draw_buttons(self, screen, hero, selected_action):
+        """
+        Draw the action buttons, highlighting the selected one.
 
-        for i, (action, rect) in enumerate(self.action_buttons.items()):
-            rect.x = button_x
-            rect.y = button_start_y + (i * button_spacing)
+        Args:
+            screen: Pygame display surface
+            hero: Player character, for the potion count
+            selected_action: Currently selected combat action
+        """
+        # Highlight selected action
+        screen.blits([(selected if action == selected_action else unselected, rect)
+                      for action, rect, selected, unselected in self._buttons],
+                     doreturn=False)
 
-            # Highlight selected action
-            color = (100, 100, 255) if action == selected_action else (64, 64, 64)
-            pygame.draw.rect(screen, color, rect)
-            pygame.draw.rect(screen, WHITE, rect, 2)
+        self._draw_potion_count(screen, hero)
 
-            # Button text
-            text = self.font.render(action.title(), True, WHITE)
-            text_rect = text.get_rect(center=rect.center)
-            screen.blit(text, text_rect)
+    def _draw_potion_count(self, screen, hero):
+        """
+        Draw the healing potion count next to the potion button.
 
-            # Add potions count if it's the potion button
-            if action == 'potion':
-                potion_count = self.font.render(f"x{hero.healing_potions}", True, WHITE)
-                screen.blit(potion_count, (rect.right + 10, rect.centery - 10))
+        Args:
+            screen: Pygame display surface
+            hero: Player character
+        """
+        screen.blit(self._render(f"x{hero.healing_potions}"), self._potion_count_pos)
 
     def _draw_health_bar(self, screen, pos, current, maximum):
         """
@@ -249,18 +555,18 @@ class CombatUI:
             current: Current health points
             maximum: Maximum health points
         """
-        width = 200
-        height = 20
-
-        # Background (empty bar)
-        pygame.draw.rect(screen, (64, 0, 0), (*pos, width, height))
+        bar = self._hp_bar_bg
+        fill = self._hp_bar_fill
+        inner = self._hp_bar_inner
+        fill.topleft = pos
+        inner.topleft = (pos[0] + 2, pos[1] + 2)
 
-        # Health fill
-        health_width = int((current / maximum) * width)
-        pygame.draw.rect(screen, (255, 0, 0), (*pos, health_width, height))
+        # Background (empty bar and border)
+        screen.blit(bar, pos)
 
-        # Border
-        pygame.draw.rect(screen, WHITE, (*pos, width, height), 2)
+        # Health fill, kept inside the border
+        fill.width = int((current / maximum) * bar.get_width())
+        screen.fill((255, 0, 0), fill.clip(inner))
 
     def handle_click(self, pos):
         """
@@ -282,7 +588,7 @@ class CombatUI:
         Returns:
             str or None: Selected action or None if no button clicked
         """
-        for action, rect in self.action_buttons.items():
+        for action, rect, _, _ in self._buttons:
             if rect.collidepoint(pos):
                 return action
         return None
\ No newline at end of file
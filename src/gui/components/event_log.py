@@ -1,7 +1,18 @@
 import pygame
+import string
 import time
-from typing import List, Dict, Any
-from ..constants import WHITE, RED, DARK_GRAY
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Any, List, Optional
+from ..constants import WHITE, DARK_GRAY
+from .fonts import ACTION_MAN, get_font
+
+
+class _ColorMap(dict):
+    """Message color palette that falls back to the 'default' color for unknown types."""
+
+    def __missing__(self, key):
+        return self['default']
 
 
 class EventLog:
@@ -61,25 +72,34 @@ class EventLog:
                 Maximum number of messages to retain.
                 Defaults to 100.
         """
-        self.messages: List[Dict[str, Any]] = []
+        # Bounded history; the deque drops the oldest message once full
+        self.messages: Deque[Dict[str, Any]] = deque(maxlen=max_messages)
         self.max_messages = max_messages
-        self.scroll_position = 0
+        self._scroll_position = 0
 
-        # Load Action Man font if available, else fall back to system default
-        try:
-            self.font = pygame.font.Font("src/assets/fonts/ActionMan.ttf", 16)
-        except FileNotFoundError:
-            print("Could not load Action Man font, falling back to system default")
-            self.font = pygame.font.SysFont("arial", 16)
+        # Composite of the last drawn log, reused until something changes
+        self._dirty = True
+        self._cache_surf = None
+
+        # Screen areas whose log contents changed since the caller last
+        # pushed them to the display (see consume_dirty)
+        self.dirty_rects: List[pygame.Rect] = []
+
+        # Shared Action Man font (falls back to the system default)
+        self.font = get_font(ACTION_MAN, 16)
+
+        # Advance widths of printable ASCII characters, for estimating line
+        # widths while word-wrapping without measuring every candidate line
+        self._glyph_w = {c: self.font.size(c)[0] for c in string.printable}
 
         # Different colors for different message types
-        self.colors = {
+        self.colors = _ColorMap({
             'combat': (255, 180, 180),  # Light red for combat
             'item': (180, 255, 180),  # Light green for items
             'movement': (180, 180, 255),  # Light blue for movement
             'system': (255, 255, 180),  # Light yellow for system messages
             'default': WHITE
-        }
+        })
 
     def add_message(self, text: str, message_type: str = 'default', is_system: bool = False):
         """
@@ -93,9 +113,8 @@ class EventLog:
 
         Logging Workflow:
         1. Create message dictionary with rich metadata
-        2. Append to message history
-        3. Manage message list size
-        4. Print to console with appropriate formatting
+        2. Append to the bounded message history
+        3. Print to console with appropriate formatting
 
         Args:
             text (str): Message content
@@ -111,7 +130,7 @@ class EventLog:
             'time': time.time(),
             'type': message_type,
             'is_system': is_system,
-            'color': self.colors.get(message_type, self.colors['default'])
+            'color': self.colors[message_type]
         }
         self.messages.append(message)
 
@@ -119,14 +138,134 @@ class EventLog:
         prefix = "[!]" if is_system else "[+]"
         print(f"{prefix} {text}")
 
-        if len(self.messages) > self.max_messages:
-            self.messages.pop(0)
         self.scroll_position = max(0, len(self.messages) - 10)
+        self._dirty = True
+
+    @property
+    def scroll_position(self) -> int:
+        """Index of the first message shown in the log."""
+        return self._scroll_position
+
+    @scroll_position.setter
+    def scroll_position(self, value: int):
+        if value != self._scroll_position:
+            self._scroll_position = value
+            self._dirty = True
+
+    def _text_width_estimate(self, text: str) -> Optional[int]:
+        """
+        Estimate the rendered width of text from per-character widths.
+
+        Args:
+            text (str): Text to estimate
+
+        Returns:
+            Optional[int]: Sum of the glyph widths, or None if the text has
+                           characters outside printable ASCII
+        """
+        glyph_w = self._glyph_w
+        try:
+            return sum(glyph_w[c] for c in text)
+        except KeyError:
+            return None
+
+    def _wrap(self, text: str, max_width: int) -> List[str]:
+        """
+        Split a message into lines that fit the log width.
+
+        Words are added to a line until it would overflow; a single word
+        wider than the log is kept on a line of its own.
+
+        Measurement Strategy:
+        - A running estimate from the glyph width table tracks the line
+        - Lines estimated to fit with a pixel of slack per character are
+          accepted without asking the font
+        - Only lines near or past the limit (or with non-ASCII text) are
+          measured with font.size, which has the final say
+
+        Args:
+            text (str): Message content
+            max_width (int): Maximum line width in pixels
+
+        Returns:
+            List[str]: The wrapped lines
+        """
+        space_w = self._glyph_w[' ']
+        lines = []
+        current_line = []
+        estimate = 0
+
+        for word in text.split():
+            word_w = self._text_width_estimate(word)
+            current_line.append(word)
+            if estimate is not None and word_w is not None:
+                estimate += word_w if len(current_line) == 1 else word_w + space_w
+            else:
+                estimate = None
+            test_line = ' '.join(current_line)
+
+            # Kerning and rounding shift the real width by less than a pixel
+            # per character, so well-inside lines need no measuring
+            if estimate is not None and estimate + len(test_line) <= max_width:
+                continue
+
+            if self.font.size(test_line)[0] > max_width:
+                if len(current_line) > 1:
+                    current_line.pop()
+                    lines.append(' '.join(current_line))
+                    current_line = [word]
+                    estimate = word_w
+                else:
+                    lines.append(test_line)
+                    current_line = []
+                    estimate = 0
+
+        if current_line:
+            lines.append(' '.join(current_line))
+        return lines
 
     def draw(self, surface: pygame.Surface, rect: pygame.Rect):
         """
         Render the event log on a given surface.
 
+        The log is composited into a cached surface of the rect's size and
+        only recomposited after a new message, a scroll or a resize; every
+        other frame is a single blit. Recomposited areas are recorded in
+        dirty_rects.
+
+        Args:
+            surface (pygame.Surface): Surface to render log on
+            rect (pygame.Rect): Rectangular area for log display
+        """
+        if self._cache_surf is None or self._cache_surf.get_size() != rect.size:
+            self._cache_surf = pygame.Surface(rect.size)
+            self._dirty = True
+
+        if self._dirty:
+            self._draw_contents(self._cache_surf, self._cache_surf.get_rect())
+            self._dirty = False
+            self.dirty_rects.append(pygame.Rect(rect))
+
+        surface.blit(self._cache_surf, rect.topleft)
+
+    def consume_dirty(self) -> List[pygame.Rect]:
+        """
+        Hand over the areas where the log changed since the last call.
+
+        Callers that update the display region by region can pass the
+        result straight to pygame.display.update().
+
+        Returns:
+            List[pygame.Rect]: Changed log areas, empty if the log is unchanged
+        """
+        dirty = self.dirty_rects
+        self.dirty_rects = []
+        return dirty
+
+    def _draw_contents(self, surface: pygame.Surface, rect: pygame.Rect):
+        """
+        Draw the log's background, messages and scroll indicators.
+
         Implements a sophisticated rendering strategy that:
         - Draws log background
         - Handles message word-wrapping
@@ -136,56 +275,47 @@ class EventLog:
         Rendering Process:
         1. Draw background rectangle
         2. Calculate visible messages
-        3. Implement intelligent word-wrapping
-        4. Render messages with type-specific colors
+        3. Word-wrap and render each message once, caching the lines
+        4. Blit the cached lines in their type-specific colors
         5. Add scroll indicators if needed
 
         Args:
-            surface (pygame.Surface): Surface to render log on
-            rect (pygame.Rect): Rectangular area for log display
+            surface (pygame.Surface): Cached log surface to draw into
+            rect (pygame.Rect): Area of that surface covered by the log
         """
         # Draw background
-        pygame.draw.rect(surface, DARK_GRAY, rect)
+        surface.fill(DARK_GRAY, rect)
 
         # Calculate visible messages
         messages_per_page = rect.height // 20  # Reduced from 25 to 20 for better spacing
-        visible_messages = self.messages[self.scroll_position:
-                                         self.scroll_position + messages_per_page]
+        visible_messages = islice(self.messages, self.scroll_position,
+                                  self.scroll_position + messages_per_page)
 
         # Draw messages
         y = rect.top + 5
         max_width = rect.width - 10  # Leave 5px padding on each side
 
+        blits = []
         for msg in visible_messages:
-            # Word wrap text if it's too long
-            words = msg['text'].split()
-            lines = []
-            current_line = []
-
-            for word in words:
-                current_line.append(word)
-                test_line = ' '.join(current_line)
-                if self.font.size(test_line)[0] > max_width:
-                    if len(current_line) > 1:
-                        current_line.pop()
-                        lines.append(' '.join(current_line))
-                        current_line = [word]
-                    else:
-                        lines.append(test_line)
-                        current_line = []
-
-            if current_line:
-                lines.append(' '.join(current_line))
-
-            # Draw each line
-            for line in lines:
-                text = self.font.render(line, True, msg['color'])
-                surface.blit(text, (rect.left + 5, y))
+            # Wrap and render each message once; only redo it if the width changes
+            wrap_key = (msg['text'], max_width)
+            if msg.get('_wrap_key') != wrap_key:
+                msg['_wrapped'] = self._wrap(msg['text'], max_width)
+                msg['_line_surfs'] = [self.font.render(line, True, msg['color'])
+                                      for line in msg['_wrapped']]
+                msg['_wrap_key'] = wrap_key
+
+            # Queue each line
+            for text in msg['_line_surfs']:
+                blits.append((text, (rect.left + 5, y)))
                 y += 20
 
                 if y > rect.bottom - 20:
                     break
 
+        # Draw every line in one call
+        surface.blits(blits, doreturn=False)
+
         # Draw scroll indicators if needed
         if self.scroll_position > 0:
             pygame.draw.polygon(surface, WHITE,
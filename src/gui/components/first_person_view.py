@@ -1,6 +1,30 @@
 import pygame
-from typing import Tuple, Dict, Optional
+import pygame.gfxdraw
+from collections import OrderedDict
+from typing import Tuple, Dict, List, Optional
 from ..constants import *
+from .fonts import get_font
+from .surfaces import to_display_format
+from ...dungeon.room import Room
+
+# Absolute (forward, left, right) directions for each way the hero can face
+_REL_KEYS = {
+    'N': ('N', 'W', 'E'),
+    'S': ('S', 'E', 'W'),
+    'E': ('E', 'N', 'S'),
+    'W': ('W', 'S', 'N')
+}
+_NO_KEYS = ('', '', '')
+
+# Marker color and label for each item type shown on the floor
+_ITEMS = {
+    "health_potion": (RED, "Health Potion"),
+    "vision_potion": ((0, 0, 255), "Vision Potion")
+}
+_DEFAULT_ITEM = ((255, 255, 0), "Item")  # Yellow
+
+# Label shown above each pillar
+_PILLAR_LABELS = {pillar: f"Pillar of {pillar}" for pillar in Room.PILLARS}
 
 
 class FirstPersonView:
@@ -30,18 +54,46 @@ class FirstPersonView:
        - Support different room states
     """
 
+    # Color definitions
+    WALL_COLOR = (80, 80, 80)  # Gray
+    CEILING_COLOR = (40, 40, 60)  # Dark blue-gray
+    FLOOR_COLOR = (60, 50, 40)  # Brown
+    DOOR_COLOR = (120, 80, 40)  # Wood brown
+
+    # Placeholder colors for content
+    MONSTER_COLOR = (200, 40, 40)  # Red
+    ITEM_COLOR = (220, 220, 40)  # Yellow
+    PILLAR_COLOR = (40, 200, 200)  # Cyan
+
+    # Radius of the round item markers on the floor
+    ITEM_RADIUS = 15
+
+    # Fixed attribute layout; the draw path reads these every frame
+    __slots__ = (
+        'rect', 'textures', 'max_cached_texts', 'max_cached_views',
+        # Caches
+        '_item_sprites', '_corridor_cache', '_corridor_size', '_shells',
+        '_views', '_shown', '_font', '_text_cache',
+        # Geometry, see _recompute_geometry
+        '_geometry_size', '_ceiling_rect', '_floor_rect', '_left_wall_poly',
+        '_right_wall_poly', '_perspective_lines', '_perspective_edges', '_forward_door_rect',
+        '_forward_handle', '_left_door_poly', '_left_handle', '_right_door_poly',
+        '_right_handle', '_monster_rect', '_monster_label_pos', '_pillar_rect',
+        '_pillar_label_pos', '_health_potion_pos', '_vision_potion_pos', '_label_pos',
+        # Baked door, monster and pillar surfaces with their positions
+        '_forward_door', '_left_door', '_right_door', '_monster_sprite', '_pillar_sprite'
+    )
+
     def __init__(self, screen_rect: pygame.Rect):
         """
         Initialize the first-person view rendering system.
 
         Sets up the foundational visual components:
         - Define rendering area
-        - Establish color palette
         - Prepare for future texture integration
 
         Initialization Strategy:
         - Use screen rectangle for precise rendering
-        - Define consistent color schemes
         - Create placeholder for future texture enhancements
 
         Args:
@@ -50,30 +102,254 @@ class FirstPersonView:
         """
         self.rect = screen_rect
 
-        # Color definitions
-        self.WALL_COLOR = (80, 80, 80)  # Gray
-        self.CEILING_COLOR = (40, 40, 60)  # Dark blue-gray
-        self.FLOOR_COLOR = (60, 50, 40)  # Brown
-        self.DOOR_COLOR = (120, 80, 40)  # Wood brown
-
-        # Placeholder colors for content
-        self.MONSTER_COLOR = (200, 40, 40)  # Red
-        self.ITEM_COLOR = (220, 220, 40)  # Yellow
-        self.PILLAR_COLOR = (40, 200, 200)  # Cyan
-
         # Placeholder for future textures
         self.textures = {}
 
-    def draw(self, surface: pygame.Surface, dungeon, hero_pos: Tuple[int, int], hero_direction: str):
+        # Round item markers by color; they do not depend on the view size
+        self._item_sprites: Dict[Tuple[int, int, int], pygame.Surface] = {}
+
+        # The corridor only depends on the view size, so it is rendered
+        # once and re-rendered only if the view is resized
+        self._corridor_cache: Optional[pygame.Surface] = None
+        self._corridor_size: Optional[Tuple[int, int]] = None
+
+        # The corridor with each combination of doors drawn in
+        self._shells: Dict[Tuple[bool, bool, bool], pygame.Surface] = {}
+
+        # Recently composed views keyed by the room state they show, oldest
+        # first. Turning back to a view seen a moment ago only costs a blit
+        self._views: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.max_cached_views = 4
+
+        # The view state and position last blitted to the screen; None when
+        # the screen may have been painted over since
+        self._shown = None
+
+        # Wall, door and line coordinates, derived from the view size
+        self._geometry_size: Optional[Tuple[int, int]] = None
+        self._recompute_geometry()
+
+        # Rendered labels (room markers, monster, pillar and item names)
+        # with their shadows and centering offsets, keyed by text
+        self._font = get_font(None, 24)
+        self._text_cache: Dict[str, tuple] = {}
+        self.max_cached_texts = 64
+
+    def _recompute_geometry(self):
+        """
+        Precompute the corridor, door and content shapes for the current view size.
+
+        Every vertex depends only on the width and height of the view, so
+        they are worked out once here (and again after a resize) instead
+        of on every frame.
+        """
+        width, height = self.rect.width, self.rect.height
+
+        self._ceiling_rect = pygame.Rect(0, 0, width, height // 3)
+        self._floor_rect = pygame.Rect(0, height * 2 // 3, width, height // 3)
+
+        # Walls as trapezoids: top/bottom outer corners to the far wall
+        self._left_wall_poly = (
+            (0, 0),  # Top left
+            (width // 4, height // 3),  # Middle left
+            (width // 4, height * 2 // 3),  # Bottom left
+            (0, height)  # Bottom far left
+        )
+        self._right_wall_poly = (
+            (width, 0),  # Top right
+            (width * 3 // 4, height // 3),  # Middle right
+            (width * 3 // 4, height * 2 // 3),  # Bottom right
+            (width, height)  # Bottom far right
+        )
+
+        # Perspective and dividing lines as polylines: each wall's top
+        # diagonal continues into its vertical divider, then the bottom
+        # diagonals and horizontal dividers. Thick lines rasterize
+        # differently depending on direction, so every segment keeps the
+        # direction it has always been drawn in
+        self._perspective_lines = (
+            ((0, 0), (width // 4, height // 3), (width // 4, height * 2 // 3)),
+            ((width, 0), (width * 3 // 4, height // 3), (width * 3 // 4, height * 2 // 3)),
+            ((0, height), (width // 4, height * 2 // 3)),
+            ((width, height), (width * 3 // 4, height * 2 // 3)),
+            ((0, height // 3), (width, height // 3)),
+            ((0, height * 2 // 3), (width, height * 2 // 3)),
+        )
+
+        # Antialiased edges either side of each diagonal, one pixel out
+        # across the line's thickness
+        diagonals = (
+            ((0, 0), (width // 4, height // 3)),
+            ((width, 0), (width * 3 // 4, height // 3)),
+            ((0, height), (width // 4, height * 2 // 3)),
+            ((width, height), (width * 3 // 4, height * 2 // 3)),
+        )
+        edges = []
+        for (x0, y0), (x1, y1) in diagonals:
+            steep = abs(y1 - y0) > abs(x1 - x0)
+            for offset in (-1, 1):
+                dx, dy = (offset, 0) if steep else (0, offset)
+                edges.append(((x0 + dx, y0 + dy), (x1 + dx, y1 + dy)))
+        self._perspective_edges = tuple(edges)
+
+        # Forward door centered on the far wall, handle three quarters across
+        door_width = width // 3
+        door_height = height // 3
+        self._forward_door_rect = pygame.Rect((width - door_width) // 2, height // 3,
+                                              door_width, door_height)
+        self._forward_handle = (self._forward_door_rect.x + door_width * 3 // 4,
+                                self._forward_door_rect.y + door_height // 2)
+
+        # Side doors as polygons to match the wall perspective
+        self._left_door_poly = (
+            (width // 8, height // 3 + height // 12),  # Top left
+            (width // 4 - 10, height // 3 + height // 12),  # Top right
+            (width // 4 - 10, height * 2 // 3 - height // 12),  # Bottom right
+            (width // 8, height * 2 // 3 - height // 12)  # Bottom left
+        )
+        self._left_handle = (width // 4 - 20, height // 2)
+        self._right_door_poly = (
+            (width * 3 // 4 + 10, height // 3 + height // 12),  # Top left
+            (width * 7 // 8, height // 3 + height // 12),  # Top right
+            (width * 7 // 8, height * 2 // 3 - height // 12),  # Bottom right
+            (width * 3 // 4 + 10, height * 2 // 3 - height // 12)  # Bottom left
+        )
+        self._right_handle = (width * 3 // 4 + 20, height // 2)
+
+        # Room contents: monster and pillar centered in the corridor with
+        # their names above them, potions on the floor either side
+        center_x, center_y = width // 2, height // 2
+        size = min(width, height) // 4
+        self._monster_rect = pygame.Rect(center_x - size // 2, center_y - size // 2, size, size)
+        self._monster_label_pos = (center_x, self._monster_rect.top - 20)
+        pillar_width, pillar_height = width // 8, height // 3
+        self._pillar_rect = pygame.Rect(center_x - pillar_width // 2, center_y - pillar_height // 2,
+                                        pillar_width, pillar_height)
+        self._pillar_label_pos = (center_x, self._pillar_rect.top - 20)
+        self._health_potion_pos = (width // 4, height - 100)
+        self._vision_potion_pos = (width * 3 // 4, height - 100)
+        self._label_pos = (center_x, 40)
+
+        # Doors, the monster and the pillar never change shape for a given
+        # size, so bake each one
+        self._forward_door = self._bake_door(self._forward_door_rect, self._forward_handle, 5)
+        self._left_door = self._bake_door(self._left_door_poly, self._left_handle, 3)
+        self._right_door = self._bake_door(self._right_door_poly, self._right_handle, 3)
+        self._monster_sprite = self._bake_box(self._monster_rect, self.MONSTER_COLOR)
+        self._pillar_sprite = self._bake_box(self._pillar_rect, self.PILLAR_COLOR)
+
+        self._geometry_size = self.rect.size
+        self._shells.clear()
+        self._views.clear()
+        self._shown = None
+
+    def resize(self, screen_rect: pygame.Rect):
+        """
+        Move or resize the view and rebuild everything derived from its size.
+
+        Callers should go through here rather than mutating self.rect in
+        place. draw() still notices a changed size, but only after a
+        frame has already gone through the old caches.
+
+        Args:
+            screen_rect (pygame.Rect): New area for first-person view rendering
+        """
+        self.rect = pygame.Rect(screen_rect)
+        if self._geometry_size != self.rect.size:
+            self._corridor_cache = None
+            self._recompute_geometry()
+        self.invalidate()
+
+    def _bake_door(self, shape, handle: Tuple[int, int], handle_radius: int):
+        """
+        Render a door (fill, border and handle) onto its own surface.
+
+        The surface covers the door's bounding box plus a small margin for
+        the border and is transparent outside the door, so blitting it
+        over the corridor looks exactly like drawing the door in place.
+
+        Args:
+            shape: pygame.Rect for the forward door, or polygon vertices
+                   for a side door
+            handle: (x, y) of the handle in view coordinates
+            handle_radius: Radius of the handle
+
+        Returns:
+            Tuple[pygame.Surface, Tuple[int, int]]: The door surface and
+                                                    where to blit it
+        """
+        if isinstance(shape, pygame.Rect):
+            points = (shape.topleft, shape.bottomright)
+        else:
+            points = shape
+        xs = [x for x, _ in points] + [handle[0] - handle_radius, handle[0] + handle_radius]
+        ys = [y for _, y in points] + [handle[1] - handle_radius, handle[1] + handle_radius]
+        margin = 2
+        left, top = min(xs) - margin, min(ys) - margin
+        door = pygame.Surface((max(xs) - left + margin + 1, max(ys) - top + margin + 1), pygame.SRCALPHA)
+
+        local_handle = (handle[0] - left, handle[1] - top)
+        if isinstance(shape, pygame.Rect):
+            local_rect = shape.move(-left, -top)
+            pygame.draw.rect(door, self.DOOR_COLOR, local_rect)
+            pygame.draw.rect(door, BLACK, local_rect, 2)  # Border
+        else:
+            local_poly = [(x - left, y - top) for x, y in shape]
+            pygame.draw.polygon(door, self.DOOR_COLOR, local_poly)
+            pygame.draw.polygon(door, BLACK, local_poly, 2)  # Border
+        pygame.draw.circle(door, BLACK, local_handle, handle_radius)
+
+        return to_display_format(door, alpha=True), (left, top)
+
+    def _bake_box(self, rect: pygame.Rect, color: Tuple[int, int, int]):
+        """
+        Render a bordered placeholder box (monster or pillar) once.
+
+        Args:
+            rect: Where the box sits in the view
+            color: Fill color inside the black border
+
+        Returns:
+            Tuple[pygame.Surface, Tuple[int, int]]: The box surface and
+                                                    where to blit it
+        """
+        box = pygame.Surface(rect.size)
+        box.fill(color)
+        pygame.draw.rect(box, BLACK, box.get_rect(), 2)  # Border
+        return to_display_format(box), rect.topleft
+
+    def _item_sprite(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Get the round item marker in the given color, rendering it once.
+
+        Args:
+            color: Fill color inside the black border
+
+        Returns:
+            pygame.Surface: Transparent surface with the marker centered
+                            ITEM_RADIUS + 2 pixels from its top left
+        """
+        sprite = self._item_sprites.get(color)
+        if sprite is None:
+            size = self.ITEM_RADIUS * 2 + 5
+            center = (self.ITEM_RADIUS + 2, self.ITEM_RADIUS + 2)
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, center, self.ITEM_RADIUS)
+            pygame.draw.circle(sprite, BLACK, center, self.ITEM_RADIUS, 2)  # Border
+            sprite = to_display_format(sprite, alpha=True)
+            self._item_sprites[color] = sprite
+        return sprite
+
+    def draw(self, surface: pygame.Surface, dungeon, hero_pos: Tuple[int, int],
+             hero_direction: str) -> List[pygame.Rect]:
         """
         Render the complete first-person view of the current room.
 
         Comprehensive rendering method that:
-        1. Clears previous view
-        2. Retrieves current room data
-        3. Draws basic corridor structure
-        4. Renders room-specific contents
-        5. Displays special room indicators
+        1. Retrieves current room data
+        2. Reuses a recently composed view if it shows the same thing
+        3. Otherwise draws the corridor, doors and room contents
+        4. Displays special room indicators
 
         Rendering Workflow:
         - Validate room existence
@@ -87,42 +363,132 @@ class FirstPersonView:
             dungeon: Dungeon object containing room data
             hero_pos: Current hero coordinates
             hero_direction: Direction hero is facing
+
+        Returns:
+            List[pygame.Rect]: Screen regions that were drawn, for
+                               pygame.display.update(); empty when the
+                               screen already shows this view
         """
-        # Clear the view area
-        pygame.draw.rect(surface, BLACK, self.rect)
+        if self._geometry_size != self.rect.size:
+            self._recompute_geometry()
 
         # Get current room
         current_room = dungeon.get_room(*hero_pos)
         if not current_room:
-            return
+            # Clear the view area
+            pygame.draw.rect(surface, BLACK, self.rect)
+            self._shown = None
+            return [self.rect.copy()]
+
+        # Same facing and same visible contents look the same, so reuse
+        # a recently composed view
+        key = self._view_state(current_room, hero_direction)
+        view = self._views.get(key)
+        if view is None:
+            if self._views and len(self._views) >= self.max_cached_views:
+                # Recycle the least recently shown view's surface
+                _, view = self._views.popitem(last=False)
+            else:
+                view = to_display_format(pygame.Surface(self.rect.size))
+            self._render_view(view, current_room, hero_direction)
+            self._views[key] = view
+        else:
+            self._views.move_to_end(key)
 
-        # Basic corridor drawing (floor, ceiling, walls)
-        self._draw_corridor(surface)
+        shown = (key, self.rect.topleft)
+        if shown == self._shown:
+            return []
+
+        surface.blit(view, self.rect.topleft)
+        self._shown = shown
+        return [self.rect.copy()]
+
+    def invalidate(self):
+        """
+        Forget what is on screen so the next draw blits the view again.
+
+        Call this after anything else paints over the view area, such as
+        a full-screen clear.
+        """
+        self._shown = None
+
+    def _view_state(self, room, hero_direction: str) -> tuple:
+        """
+        Summarize everything in a room that shows up in the view.
+
+        Args:
+            room: Current room object
+            hero_direction: Hero's current facing direction
+
+        Returns:
+            tuple: Facing, visible doors and contents; equal tuples draw
+                   identical views
+        """
+        monster = room.monster
+        return (
+            *self._visible_doors(room, hero_direction),
+            monster.name if monster and monster.is_alive else None,
+            room.pillarType if room.hasPillar else None,
+            room.hasHealthPot, room.hasVisionPot,
+            room.isEntrance, room.isExit
+        )
+
+    def _render_view(self, surface: pygame.Surface, current_room, hero_direction: str):
+        """
+        Compose the corridor, doors and room contents into the view surface.
 
-        # Draw doors in available directions
-        self._draw_doors(surface, current_room, hero_direction)
+        Everything in the view is a pre-rendered surface: the corridor and
+        doors come as one opaque shell and the room contents go on top.
+        The layers are collected bottom to top and drawn with a single
+        blits call.
 
-        # Draw room contents if visible
+        Args:
+            surface: View-sized surface to render into
+            current_room: Room the hero is standing in
+            hero_direction: Direction hero is facing
+        """
+        # Corridor (floor, ceiling, walls) with the doors in available
+        # directions; covers the whole view
+        layers = [(self._get_shell(self._visible_doors(current_room, hero_direction)), (0, 0))]
+
+        # Room contents if visible
         if current_room.monster and current_room.monster.is_alive:
-            self._draw_monster(surface, current_room.monster)
+            layers += self._monster_layers(current_room.monster)
 
         if current_room.hasPillar:
-            self._draw_pillar(surface, current_room.pillarType)
+            layers += self._pillar_layers(current_room.pillarType)
 
         if current_room.hasHealthPot:
-            self._draw_item(surface, "health_potion", (self.rect.width // 4, self.rect.bottom - 100))
+            layers += self._item_layers("health_potion", self._health_potion_pos)
 
         if current_room.hasVisionPot:
-            self._draw_item(surface, "vision_potion", (self.rect.width * 3 // 4, self.rect.bottom - 100))
+            layers += self._item_layers("vision_potion", self._vision_potion_pos)
 
-        # Draw entrance/exit indicators
+        # Entrance/exit indicators
         if current_room.isEntrance:
-            self._draw_text(surface, "ENTRANCE", (self.rect.centerx, 40))
+            layers += self._text_layers("ENTRANCE", self._label_pos)
 
         if current_room.isExit:
-            self._draw_text(surface, "EXIT", (self.rect.centerx, 40))
+            layers += self._text_layers("EXIT", self._label_pos)
+
+        surface.blits(layers, doreturn=False)
+
+    def _get_corridor(self) -> pygame.Surface:
+        """
+        Get the cached corridor, rendering it first if needed.
+
+        Returns:
+            pygame.Surface: View-sized corridor surface
+        """
+        if self._corridor_cache is None or self._corridor_size != self.rect.size:
+            corridor = pygame.Surface(self.rect.size)
+            self._render_corridor(corridor)
+            self._corridor_cache = to_display_format(corridor)
+            self._corridor_size = self.rect.size
+
+        return self._corridor_cache
 
-    def _draw_corridor(self, surface: pygame.Surface):
+    def _render_corridor(self, surface: pygame.Surface):
         """
         Generate the base corridor structure with perspective.
 
@@ -138,252 +504,90 @@ class FirstPersonView:
         - Create visual depth through geometric manipulation
 
         Args:
-            surface: Pygame surface for rendering corridor
+            surface: Corridor-sized surface to render into
         """
-        width, height = self.rect.width, self.rect.height
-
-        # Draw ceiling
-        ceiling_rect = pygame.Rect(0, 0, width, height // 3)
-        pygame.draw.rect(surface, self.CEILING_COLOR, ceiling_rect)
-
-        # Draw floor
-        floor_rect = pygame.Rect(0, height * 2 // 3, width, height // 3)
-        pygame.draw.rect(surface, self.FLOOR_COLOR, floor_rect)
-
-        # Draw left wall (trapezoid)
-        left_wall = [
-            (0, 0),  # Top left
-            (width // 4, height // 3),  # Middle left
-            (width // 4, height * 2 // 3),  # Bottom left
-            (0, height)  # Bottom far left
-        ]
-        pygame.draw.polygon(surface, self.WALL_COLOR, left_wall)
-
-        # Draw right wall (trapezoid)
-        right_wall = [
-            (width, 0),  # Top right
-            (width * 3 // 4, height // 3),  # Middle right
-            (width * 3 // 4, height * 2 // 3),  # Bottom right
-            (width, height)  # Bottom far right
-        ]
-        pygame.draw.polygon(surface, self.WALL_COLOR, right_wall)
+        # Draw ceiling and floor
+        pygame.draw.rect(surface, self.CEILING_COLOR, self._ceiling_rect)
+        pygame.draw.rect(surface, self.FLOOR_COLOR, self._floor_rect)
 
-        # Draw perspective lines
-        pygame.draw.line(surface, (0, 0, 0), (0, 0), (width // 4, height // 3), 2)
-        pygame.draw.line(surface, (0, 0, 0), (width, 0), (width * 3 // 4, height // 3), 2)
-        pygame.draw.line(surface, (0, 0, 0), (0, height), (width // 4, height * 2 // 3), 2)
-        pygame.draw.line(surface, (0, 0, 0), (width, height), (width * 3 // 4, height * 2 // 3), 2)
+        # Draw left and right walls (trapezoids) with antialiased edges;
+        # this only runs when the corridor cache is rebuilt
+        for wall in (self._left_wall_poly, self._right_wall_poly):
+            pygame.gfxdraw.filled_polygon(surface, wall, self.WALL_COLOR)
+            pygame.gfxdraw.aapolygon(surface, wall, self.WALL_COLOR)
 
-        # Horizontal dividing lines
-        pygame.draw.line(surface, (0, 0, 0), (0, height // 3), (width, height // 3), 2)
-        pygame.draw.line(surface, (0, 0, 0), (0, height * 2 // 3), (width, height * 2 // 3), 2)
+        # Draw perspective and dividing lines
+        for points in self._perspective_lines:
+            pygame.draw.lines(surface, BLACK, False, points, 2)
 
-        # Vertical dividing lines
-        pygame.draw.line(surface, (0, 0, 0), (width // 4, height // 3), (width // 4, height * 2 // 3), 2)
-        pygame.draw.line(surface, (0, 0, 0), (width * 3 // 4, height // 3), (width * 3 // 4, height * 2 // 3), 2)
+        # Soften both sides of the diagonal perspective lines
+        for start, end in self._perspective_edges:
+            pygame.draw.aaline(surface, BLACK, start, end)
 
-    def _get_relative_doors(self, room, hero_direction: str) -> Dict[str, bool]:
+    def _visible_doors(self, room, hero_direction: str) -> Tuple[bool, bool, bool]:
         """
-        Convert absolute door directions to relative perspective.
+        Work out which doors show based on room configuration and hero's perspective.
 
-        Implements a dynamic direction mapping that:
-        - Adjusts door visibility based on hero's facing direction
-        - Provides consistent door representation
-        - Supports multi-directional navigation
-
-        Direction Mapping Strategy:
-        1. Define transformation matrix for different facing directions
-        2. Translate absolute directions to relative view
-        3. Return door presence from hero's perspective
+        Looks up the absolute directions in front, left and right of the
+        hero's facing and checks the room's doors in those directions.
 
         Args:
             room: Current room object
             hero_direction: Hero's current facing direction
 
         Returns:
-            Dictionary of relative door positions and their presence
-        """
-        # Map of how directions change based on facing
-        direction_map = {
-            'N': {'forward': 'N', 'left': 'W', 'right': 'E'},
-            'S': {'forward': 'S', 'left': 'E', 'right': 'W'},
-            'E': {'forward': 'E', 'left': 'N', 'right': 'S'},
-            'W': {'forward': 'W', 'left': 'S', 'right': 'N'}
-        }
-
-        # Get mapping for current direction
-        dir_map = direction_map.get(hero_direction, {})
-
-        # Return dictionary of relative directions with door presence
-        return {
-            'forward': room.doors.get(dir_map.get('forward', ''), False),
-            'left': room.doors.get(dir_map.get('left', ''), False),
-            'right': room.doors.get(dir_map.get('right', ''), False)
-        }
-
-    def _draw_doors(self, surface: pygame.Surface, room, hero_direction: str):
+            Tuple[bool, bool, bool]: Whether there is a door ahead, on the
+                                     left wall and on the right wall
         """
-        Render doors based on room configuration and hero's perspective.
-
-        Implements comprehensive door rendering that:
-        - Identifies available doors
-        - Draws doors in correct relative positions
-        - Supports multiple door orientations
+        forward, left, right = _REL_KEYS.get(hero_direction, _NO_KEYS)
+        doors = room.doors
+        return bool(doors.get(forward)), bool(doors.get(left)), bool(doors.get(right))
 
-        Door Rendering Process:
-        1. Convert absolute to relative door directions
-        2. Identify doors in forward, left, and right positions
-        3. Render doors with perspective-correct positioning
-
-        Args:
-            surface: Pygame surface for rendering
-            room: Current room object
-            hero_direction: Hero's current facing direction
+    def _get_shell(self, visible_doors: Tuple[bool, bool, bool]) -> pygame.Surface:
         """
-        width, height = self.rect.width, self.rect.height
-
-        # Get available doors adjusted for hero's perspective
-        doors = self._get_relative_doors(room, hero_direction)
-
-        # Draw forward door (if present)
-        if doors.get('forward'):
-            self._draw_forward_door(surface)
-
-        # Draw left door (if present)
-        if doors.get('left'):
-            self._draw_left_door(surface)
-
-        # Draw right door (if present)
-        if doors.get('right'):
-            self._draw_right_door(surface)
-
-    def _draw_forward_door(self, surface: pygame.Surface):
-        """Draw door at the end of the corridor"""
-        width, height = self.rect.width, self.rect.height
-
-        # Calculate door dimensions (centered in corridor)
-        door_width = width // 3
-        door_height = height // 3
+        Get the corridor with the given doors drawn in, rendering it once.
 
-        # Door position
-        x = (width - door_width) // 2
-        y = height // 3
+        There are only eight door combinations per view size, so each is
+        kept as an opaque surface and the room contents are layered on
+        top without redrawing the corridor and doors underneath.
 
-        # Draw door
-        door_rect = pygame.Rect(x, y, door_width, door_height)
-        pygame.draw.rect(surface, self.DOOR_COLOR, door_rect)
-        pygame.draw.rect(surface, (0, 0, 0), door_rect, 2)  # Border
-
-        # Draw door handle
-        handle_x = x + door_width * 3 // 4
-        handle_y = y + door_height // 2
-        pygame.draw.circle(surface, (0, 0, 0), (handle_x, handle_y), 5)
-
-    def _draw_left_door(self, surface: pygame.Surface):
-        """Draw door on the left wall"""
-        width, height = self.rect.width, self.rect.height
-
-        # Door as a polygon to match perspective
-        door_poly = [
-            (width // 8, height // 3 + height // 12),  # Top left
-            (width // 4 - 10, height // 3 + height // 12),  # Top right
-            (width // 4 - 10, height * 2 // 3 - height // 12),  # Bottom right
-            (width // 8, height * 2 // 3 - height // 12)  # Bottom left
-        ]
-
-        # Draw door
-        pygame.draw.polygon(surface, self.DOOR_COLOR, door_poly)
-        pygame.draw.polygon(surface, (0, 0, 0), door_poly, 2)  # Border
-
-        # Door handle
-        handle_x = width // 4 - 20
-        handle_y = height // 2
-        pygame.draw.circle(surface, (0, 0, 0), (handle_x, handle_y), 3)
-
-    def _draw_right_door(self, surface: pygame.Surface):
-        """Draw door on the right wall"""
-        width, height = self.rect.width, self.rect.height
-
-        # Door as a polygon to match perspective
-        door_poly = [
-            (width * 3 // 4 + 10, height // 3 + height // 12),  # Top left
-            (width * 7 // 8, height // 3 + height // 12),  # Top right
-            (width * 7 // 8, height * 2 // 3 - height // 12),  # Bottom right
-            (width * 3 // 4 + 10, height * 2 // 3 - height // 12)  # Bottom left
-        ]
-
-        # Draw door
-        pygame.draw.polygon(surface, self.DOOR_COLOR, door_poly)
-        pygame.draw.polygon(surface, (0, 0, 0), door_poly, 2)  # Border
-
-        # Door handle
-        handle_x = width * 3 // 4 + 20
-        handle_y = height // 2
-        pygame.draw.circle(surface, (0, 0, 0), (handle_x, handle_y), 3)
-
-    def _draw_monster(self, surface: pygame.Surface, monster):
-        """Draw a monster in the corridor"""
-        width, height = self.rect.width, self.rect.height
-
-        # Center position for monster
-        center_x = width // 2
-        center_y = height // 2
-
-        # Size based on monster type (placeholder)
-        size = min(width, height) // 4
-
-        # Draw monster silhouette (placeholder)
-        monster_rect = pygame.Rect(center_x - size // 2, center_y - size // 2, size, size)
-        pygame.draw.rect(surface, self.MONSTER_COLOR, monster_rect)
-        pygame.draw.rect(surface, (0, 0, 0), monster_rect, 2)  # Border
-
-        # Draw monster name
-        self._draw_text(surface, monster.name, (center_x, center_y - size // 2 - 20))
-
-    def _draw_pillar(self, surface: pygame.Surface, pillar_type: str):
-        """Draw a pillar in the corridor"""
-        width, height = self.rect.width, self.rect.height
-
-        # Center position for pillar
-        center_x = width // 2
-        center_y = height // 2
-
-        # Pillar dimensions
-        pillar_width = width // 8
-        pillar_height = height // 3
-
-        # Draw pillar
-        pillar_rect = pygame.Rect(center_x - pillar_width // 2, center_y - pillar_height // 2,
-                                  pillar_width, pillar_height)
-        pygame.draw.rect(surface, self.PILLAR_COLOR, pillar_rect)
-        pygame.draw.rect(surface, (0, 0, 0), pillar_rect, 2)  # Border
-
-        # Draw pillar name
-        self._draw_text(surface, f"Pillar of {pillar_type}", (center_x, center_y - pillar_height // 2 - 20))
+        Args:
+            visible_doors: Door ahead, on the left and on the right, as
+                           returned by _visible_doors
 
-    def _draw_item(self, surface: pygame.Surface, item_type: str, pos: Tuple[int, int]):
-        """Draw an item in the corridor"""
+        Returns:
+            pygame.Surface: View-sized corridor with doors
+        """
+        shell = self._shells.get(visible_doors)
+        if shell is None:
+            shell = self._get_corridor().copy()
+            doors = (self._forward_door, self._left_door, self._right_door)
+            shell.blits([door for door, shown in zip(doors, visible_doors) if shown], doreturn=False)
+            self._shells[visible_doors] = shell
+        return shell
+
+    def _monster_layers(self, monster) -> list:
+        """Monster silhouette (placeholder) with its name above it"""
+        return [self._monster_sprite, *self._text_layers(monster.name, self._monster_label_pos)]
+
+    def _pillar_layers(self, pillar_type: str) -> list:
+        """Pillar with its name above it"""
+        return [self._pillar_sprite,
+                *self._text_layers(_PILLAR_LABELS.get(pillar_type) or f"Pillar of {pillar_type}",
+                                   self._pillar_label_pos)]
+
+    def _item_layers(self, item_type: str, pos: Tuple[int, int]) -> list:
+        """Item marker on the floor with its label above it"""
         # Draw item as a simple circle for now
-        if item_type == "health_potion":
-            color = (255, 0, 0)  # Red for health
-            label = "Health Potion"
-        elif item_type == "vision_potion":
-            color = (0, 0, 255)  # Blue for vision
-            label = "Vision Potion"
-        else:
-            color = (255, 255, 0)  # Yellow default
-            label = "Item"
-
-        # Draw item
-        pygame.draw.circle(surface, color, pos, 15)
-        pygame.draw.circle(surface, (0, 0, 0), pos, 15, 2)  # Border
+        color, label = _ITEMS.get(item_type, _DEFAULT_ITEM)
 
-        # Draw label
-        self._draw_text(surface, label, (pos[0], pos[1] - 25))
+        offset = self.ITEM_RADIUS + 2
+        return [(self._item_sprite(color), (pos[0] - offset, pos[1] - offset)),
+                *self._text_layers(label, (pos[0], pos[1] - 25))]
 
-    def _draw_text(self, surface: pygame.Surface, text: str, pos: Tuple[int, int]):
+    def _text_layers(self, text: str, pos: Tuple[int, int]) -> list:
         """
-        Render text with shadow effect for enhanced readability.
+        Get the shadow and text surfaces for a centered label.
 
         Creates visually appealing text rendering by:
         - Adding shadow for depth
@@ -393,21 +597,29 @@ class FirstPersonView:
         Text Rendering Strategy:
         1. Render shadow slightly offset
         2. Render primary text on top
-        3. Ensure high visibility in various contexts
+        3. Keep both renders so later frames only blit them
 
         Args:
-            surface: Pygame surface for rendering
             text: Text to be displayed
             pos: (x, y) position for text placement
-        """
-        font = pygame.font.Font(None, 24)
-
-        # Shadow
-        shadow = font.render(text, True, (0, 0, 0))
-        shadow_rect = shadow.get_rect(center=(pos[0] + 2, pos[1] + 2))
-        surface.blit(shadow, shadow_rect)
 
-        # Text
-        text_surf = font.render(text, True, (255, 255, 255))
-        text_rect = text_surf.get_rect(center=pos)
-        surface.blit(text_surf, text_rect)
\ No newline at end of file
+        Returns:
+            list: (surface, position) pairs, shadow first
+        """
+        label = self._text_cache.get(text)
+        if label is None:
+            if len(self._text_cache) >= self.max_cached_texts:
+                self._text_cache.clear()
+
+            shadow = self._font.render(text, True, BLACK)
+            text_surf = self._font.render(text, True, WHITE)
+            shadow = to_display_format(shadow, alpha=True)
+            text_surf = to_display_format(text_surf, alpha=True)
+
+            # Offsets that center the text on pos, with the shadow 2px down and right
+            dx, dy = -(text_surf.get_width() // 2), -(text_surf.get_height() // 2)
+            label = ((shadow, dx + 2, dy + 2), (text_surf, dx, dy))
+            self._text_cache[text] = label
+
+        x, y = pos
+        return [(part, (x + dx, y + dy)) for part, dx, dy in label]
@@ -0,0 +1,46 @@
+import functools
+from typing import Optional
+
+import pygame
+
+# Bundled UI font, relative to the project root the game is started from
+ACTION_MAN = "src/assets/fonts/ActionMan.ttf"
+
+
+@functools.lru_cache(maxsize=32)
+def get_font(path: Optional[str], size: int, bold: bool = False) -> pygame.font.Font:
+    """
+    Load a font once and share it between every component that uses it.
+
+    Opening a font reads the file and sets up FreeType, so components
+    (and per-frame drawing code) ask for fonts here instead of building
+    their own pygame.font.Font objects.
+
+    Fonts only live as long as the pygame session that opened them, so
+    the cache is emptied by pygame.quit(); the next session loads its
+    own.
+
+    Args:
+        path (str or None): Font file path, or None for pygame's default font
+        size (int): Point size
+        bold (bool): Render with a bold style, for titles
+
+    Returns:
+        pygame.font.Font: The loaded font, or Arial at the same size if the
+                          font file is missing
+    """
+    # First font of this session: forget every font when it ends.
+    # pygame drops its quit callbacks after running them, so this is
+    # registered again each session.
+    if get_font.cache_info().currsize == 0:
+        pygame.register_quit(get_font.cache_clear)
+
+    try:
+        font = pygame.font.Font(path, size)
+    except FileNotFoundError:
+        print(f"Could not load {path}, falling back to system default")
+        return pygame.font.SysFont("arial", size, bold=bold)
+    # Each (path, size, bold) gets its own cached Font, so setting the
+    # style here never changes a font another caller holds
+    font.bold = bold
+    return font
@@ -1,6 +1,9 @@
 import pygame
-from typing import Tuple
+from typing import List, Tuple
 from ..constants import WHITE, BLACK, DARK_GRAY
+from .fonts import ACTION_MAN, get_font
+from .surfaces import to_display_format
+from ...dungeon.room import DOOR_BITS
 
 
 class MiniMap:
@@ -65,10 +68,11 @@ class MiniMap:
         """
         self.dungeon = dungeon
         self.pillar_locations = pillar_locations
-        try:
-            self.font = pygame.font.Font("src/assets/fonts/ActionMan.ttf", 16)
-        except FileNotFoundError:
-            self.font = pygame.font.Font(None, 16)
+        # Pillar type by room, keeping the first listed if a room has two
+        self._pillar_by_pos = {}
+        for pillar, px, py in pillar_locations:
+            self._pillar_by_pos.setdefault((px, py), pillar)
+        self.font = get_font(ACTION_MAN, 16)
 
         # Enhanced colors
         self.UNEXPLORED = (20, 20, 20)  # Very dark gray
@@ -82,6 +86,60 @@ class MiniMap:
         self.MONSTER = (255, 0, 0)  # Red for monsters
         self.TRAP = (255, 100, 0)  # Orange for traps
 
+        # Room labels never change, so each is rendered once
+        self._glyphs = {
+            "☠": self._render_glyph("☠", self.MONSTER),
+            "⚡": self._render_glyph("⚡", self.TRAP),
+            "HP": self._render_glyph("HP", WHITE),
+            "VP": self._render_glyph("VP", WHITE)
+        }
+        self._pillar_glyphs = {pillar: self._render_glyph(pillar, BLACK)
+                               for pillar, _, _ in pillar_locations}
+
+        # The rendered map and the state it shows; redrawn only when the
+        # hero moves, a room is revealed or the current room changes
+        self._cache_surface = None
+        self._cache_key = None
+        # Position the map was last blitted to; None when the screen may
+        # have been painted over since
+        self._shown = None
+
+        # Every room's top left corner and label limit for the current
+        # map size, see _room_layout
+        self._layout = ()
+        self._layout_size = None
+
+        # Room backgrounds and visited rooms' doors, which only change
+        # when rooms are revealed
+        self._base_layer = None
+        self._base_key = None
+        self._base_tiles = []
+
+        # Room, door and marker tiles for the current room size
+        self._tile_size = None
+        self._room_tiles = {}
+        self._door_tiles = {}
+        self._door_sets = ()
+        self._marker_tile = None
+        self._pillar_tiles = {}
+
+        # Room tiles with their door bars already drawn on, by room color
+        # and door mask, so a room with doors is still a single blit
+        self._room_atlas = {}
+
+    def _render_glyph(self, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Render a room label in the minimap font.
+
+        Args:
+            text: Label text
+            color: Text color
+
+        Returns:
+            pygame.Surface: The rendered label
+        """
+        return to_display_format(self.font.render(text, True, color), alpha=True)
+
     def calculate_room_size(self, rect: pygame.Rect) -> Tuple[int, int]:
         """
         Dynamically calculate optimal room size for minimap rendering.
@@ -137,22 +195,129 @@ class MiniMap:
             room_rect: Rectangle representing the room
             direction: Door direction ('N', 'S', 'E', 'W')
         """
+        door_rect = self._door_rect(room_rect, direction)
+        if door_rect:
+            surface.fill(self.DOOR, door_rect)
+
+    def _door_rect(self, room_rect: pygame.Rect, direction: str):
+        """
+        Work out where a door sits on a room's edge.
+
+        Args:
+            room_rect: Rectangle representing the room
+            direction: Door direction ('N', 'S', 'E', 'W')
+
+        Returns:
+            pygame.Rect or None: The door's rectangle, or None for an
+                                 unknown direction
+        """
         door_width = max(4, room_rect.width // 8)
         door_length = room_rect.height // 3
 
-        door_rects = {
-            'N': pygame.Rect(room_rect.centerx - door_width // 2, room_rect.top,
-                             door_width, door_length),
-            'S': pygame.Rect(room_rect.centerx - door_width // 2, room_rect.bottom - door_length,
-                             door_width, door_length),
-            'E': pygame.Rect(room_rect.right - door_length, room_rect.centery - door_width // 2,
-                             door_length, door_width),
-            'W': pygame.Rect(room_rect.left, room_rect.centery - door_width // 2,
-                             door_length, door_width)
-        }
+        # Only the requested door's rect is built
+        if direction == 'N':
+            return pygame.Rect(room_rect.centerx - door_width // 2, room_rect.top,
+                               door_width, door_length)
+        if direction == 'S':
+            return pygame.Rect(room_rect.centerx - door_width // 2, room_rect.bottom - door_length,
+                               door_width, door_length)
+        if direction == 'E':
+            return pygame.Rect(room_rect.right - door_length, room_rect.centery - door_width // 2,
+                               door_length, door_width)
+        if direction == 'W':
+            return pygame.Rect(room_rect.left, room_rect.centery - door_width // 2,
+                               door_length, door_width)
+        return None
+
+    def _build_tiles(self, room_width: int, room_height: int):
+        """
+        Pre-render everything that is drawn at the same size in every room.
+
+        Each room background (fill plus border) in every room color, the
+        door bars, the player marker and the gold pillar labels become
+        small surfaces, so rendering the map is a single blits call.
+
+        Args:
+            room_width, room_height: Dimensions of each room
+        """
+        room_rect = pygame.Rect(0, 0, room_width, room_height)
+
+        self._room_tiles = {}
+        for color in (self.UNEXPLORED, self.ROOM_BG, self.CURRENT, self.ENTRANCE, self.EXIT):
+            tile = pygame.Surface(room_rect.size)
+            tile.fill(color)
+            pygame.draw.rect(tile, self.BORDER, room_rect, 1)
+            self._room_tiles[color] = to_display_format(tile)
+
+        # Door bars with their offsets from the room's top left corner
+        self._door_tiles = {}
+        for direction in ('N', 'S', 'E', 'W'):
+            door_rect = self._door_rect(room_rect, direction)
+            door = pygame.Surface(door_rect.size)
+            door.fill(self.DOOR)
+            self._door_tiles[direction] = (to_display_format(door), door_rect.topleft)
+
+        # The door bars to draw for each door mask (see Room.door_mask)
+        self._door_sets = tuple(
+            tuple(self._door_tiles[direction] for direction, bit in DOOR_BITS.items() if mask & bit)
+            for mask in range(16)
+        )
 
-        if direction in door_rects:
-            pygame.draw.rect(surface, self.DOOR, door_rects[direction])
+        marker = pygame.Surface(room_rect.size, pygame.SRCALPHA)
+        self.draw_player_marker(marker, room_rect)
+        self._marker_tile = to_display_format(marker, alpha=True)
+
+        # Pillar labels on their gold backgrounds don't depend on the room
+        # size, but are rebuilt here along with everything else
+        self._pillar_tiles = {}
+        self._room_atlas = {}
+
+        self._tile_size = (room_width, room_height)
+
+    def _room_tile(self, color: Tuple[int, int, int], door_mask: int) -> pygame.Surface:
+        """
+        Get a room tile with its door bars, compositing it on first use.
+
+        A dungeon only uses a handful of color and door combinations, so
+        these are built as they come up rather than all 80 up front.
+
+        Args:
+            color: Room background color
+            door_mask: Doors to draw, see Room.door_mask
+
+        Returns:
+            pygame.Surface: Room tile with the doors drawn on
+        """
+        key = (color, door_mask)
+        tile = self._room_atlas.get(key)
+        if tile is None:
+            tile = self._room_tiles[color]
+            if door_mask:
+                tile = tile.copy()
+                tile.blits(self._door_sets[door_mask], doreturn=False)
+            self._room_atlas[key] = tile
+        return tile
+
+    def _pillar_tile(self, pillar: str) -> pygame.Surface:
+        """
+        Get a pillar's label on its gold background, rendering it once.
+
+        Args:
+            pillar: Pillar type letter
+
+        Returns:
+            pygame.Surface: The label with a 3px gold margin
+        """
+        tile = self._pillar_tiles.get(pillar)
+        if tile is None:
+            pillar_text = self._pillar_glyphs.get(pillar)
+            if pillar_text is None:
+                pillar_text = self._pillar_glyphs[pillar] = self._render_glyph(pillar, BLACK)
+            tile = pygame.Surface(pillar_text.get_rect().inflate(6, 6).size)
+            tile.fill(self.PILLAR)
+            tile.blit(pillar_text, (3, 3))
+            tile = self._pillar_tiles[pillar] = to_display_format(tile)
+        return tile
 
     def draw_player_marker(self, surface: pygame.Surface, room_rect: pygame.Rect):
         """
@@ -181,15 +346,15 @@ class MiniMap:
         pygame.draw.circle(surface, WHITE, center, marker_size // 2, 2)
 
     def draw(self, surface: pygame.Surface, rect: pygame.Rect, hero_pos: Tuple[int, int],
-             debug_log_minimap: bool = False):
+             debug_log_minimap: bool = False) -> List[pygame.Rect]:
         """
         Render the complete minimap visualization.
 
         Comprehensive rendering method that:
-        1. Prepares the drawing surface
-        2. Calculates room sizes and positioning
-        3. Draws each room in the dungeon
-        4. Optionally logs debug information
+        1. Reuses the rendered map if nothing on it changed
+        2. Otherwise optionally logs debug information
+        3. Calculates room sizes and positioning
+        4. Draws each room in the dungeon
 
         Rendering Workflow:
         - Set up background
@@ -202,134 +367,311 @@ class MiniMap:
             surface: Pygame surface for rendering
             rect: Rectangular area for minimap
             hero_pos: Current player coordinates
-            debug_log_minimap: Flag to enable detailed logging
+            debug_log_minimap: Flag to enable detailed logging, printed
+                               whenever the map changes
+
+        Returns:
+            List[pygame.Rect]: Screen regions that were drawn, for
+                               pygame.display.update(); empty when the
+                               screen already shows this map
         """
-        pygame.draw.rect(surface, DARK_GRAY, rect)
+        key = self._state_key(rect, hero_pos)
+        if key != self._cache_key:
+            if debug_log_minimap:
+                self._log_debug_info(hero_pos)
+            if self._cache_surface is None or self._cache_surface.get_size() != rect.size:
+                self._cache_surface = to_display_format(pygame.Surface(rect.size))
+            self._render(self._cache_surface, hero_pos)
+            self._cache_key = key
+        elif rect.topleft == self._shown:
+            return []
+
+        surface.blit(self._cache_surface, rect.topleft)
+        self._shown = rect.topleft
+        return [pygame.Rect(rect)]
+
+    def invalidate(self):
+        """
+        Force the next draw to re-render and blit the map.
+
+        The map notices movement, revealed rooms and changes to the room
+        the hero stands in by itself; call this after changing any other
+        room, e.g. when loading a saved dungeon into the same minimap,
+        and after anything else paints over the map area.
+        """
+        self._cache_key = None
+        self._shown = None
+
+    def _state_key(self, rect: pygame.Rect, hero_pos: Tuple[int, int]) -> tuple:
+        """
+        Summarize everything the rendered map depends on.
+
+        Rooms only change while the hero stands in them (items are picked
+        up, monsters killed), so besides the map size, the hero position
+        and the visited rooms only the current room's contents matter.
+
+        Args:
+            rect: Rectangular area for minimap
+            hero_pos: Current player coordinates
+
+        Returns:
+            tuple: Equal keys render identical maps
+        """
+        room = self.dungeon.get_room(*hero_pos)
+        contents = None
+        if room:
+            monster = room.monster
+            contents = (bool(monster and monster.is_alive), room.hasPit,
+                        room.hasHealthPot, room.hasVisionPot)
+        return rect.size, hero_pos, self.dungeon.visited_version, contents
+
+    def _render(self, surface: pygame.Surface, hero_pos: Tuple[int, int]):
+        """
+        Draw the background and every room onto the cached map surface.
+
+        The room backgrounds and the doors of visited rooms come from the
+        base layer, which only changes when rooms are revealed. On top of
+        it go the current room and the contents of visited rooms.
+
+        Args:
+            surface: Map-sized surface to render into
+            hero_pos: Current player coordinates
+        """
+        rect = surface.get_rect()
 
         # Calculate room size and offset
         room_width, room_height = self.calculate_room_size(rect)
         offset_x = rect.left + (rect.width - (room_width * self.dungeon.size[0])) // 2
         offset_y = rect.top + (rect.height - (room_height * self.dungeon.size[1])) // 2
 
-        if debug_log_minimap:
-            self._log_debug_info(hero_pos)
+        # A map area too small for the padding leaves no room to draw in
+        if room_width <= 0 or room_height <= 0:
+            surface.fill(DARK_GRAY, rect)
+            return
+
+        if self._tile_size != (room_width, room_height):
+            self._build_tiles(room_width, room_height)
+        if self._layout_size != rect.size:
+            self._layout = self._room_layout(rect, room_width, room_height, offset_x, offset_y)
+            self._layout_size = rect.size
+
+        base_key = (rect.size, self.dungeon.visited_version)
+        if base_key != self._base_key:
+            tiles = self._room_backgrounds()
+            if self._base_layer is not None and self._base_key[0] == rect.size:
+                # Same layout: redraw only the rooms whose tile changed
+                self._base_layer.blits(
+                    [layer for layer, old in zip(tiles, self._base_tiles) if layer[0] is not old[0]],
+                    doreturn=False)
+            else:
+                self._base_layer = self._render_base_layer(rect, tiles)
+            self._base_tiles = tiles
+            self._base_key = base_key
+        surface.blit(self._base_layer, rect.topleft)
+
+        # Everything the room loop reads, looked up once
+        hero_x, hero_y = hero_pos
+        draw_contents = self._draw_contents
+        is_visited = self.dungeon.is_visited
+
+        # Collect the current room and the contents of visited rooms in
+        # drawing order, then draw them at once
+        layers = []
+        # One rect moved from room to room; the queued layers only keep
+        # tuples and label rects derived from it
+        room_rect = pygame.Rect(0, 0, room_width, room_height)
+        for y, (row, cells) in enumerate(zip(self.dungeon.maze, self._layout)):
+            for x, room in enumerate(row):
+                is_current = x == hero_x and y == hero_y
+                if not is_current and not is_visited(x, y):
+                    continue
+
+                pos = (x, y)
+                topleft, limit = cells[x]
+                room_rect.topleft = topleft
+                if is_current:
+                    self._draw_current_room(layers, room, pos, room_rect, limit)
+                else:
+                    draw_contents(layers, room, pos, room_rect, limit)
+        surface.blits(layers, doreturn=False)
+
+    def _render_base_layer(self, rect: pygame.Rect, tiles: list) -> pygame.Surface:
+        """
+        Render the background with every room's tile on it.
 
-        # Draw rooms
-        for y in range(self.dungeon.size[1]):
-            for x in range(self.dungeon.size[0]):
-                self._draw_room(surface, x, y, room_width, room_height,
-                                offset_x, offset_y, hero_pos)
+        Args:
+            rect: Map area, at the origin
+            tiles: (tile, position) pairs from _room_backgrounds
 
-    def _draw_room(self, surface, x, y, room_width, room_height, offset_x, offset_y, hero_pos):
+        Returns:
+            pygame.Surface: Map-sized base layer
         """
-        Render an individual room with its specific state and contents.
+        base = pygame.Surface(rect.size)
+        base.fill(DARK_GRAY)
+        base.blits(tiles, doreturn=False)
 
-        This method is the core of the minimap's information display,
-        responsible for:
-        - Determining room color based on state
-        - Rendering room background
-        - Drawing doors
-        - Displaying room-specific content
+        return to_display_format(base)
 
-        Content Rendering Hierarchy:
-        1. Determine room color (unexplored, visited, current)
-        2. Draw room background
-        3. Render doors
-        4. Display special contents (pillars, monsters, items)
-        5. Add player marker if applicable
+    def _room_layout(self, rect: pygame.Rect, room_width: int, room_height: int,
+                     offset_x: int, offset_y: int) -> tuple:
+        """
+        Work out where every room goes for one map size.
+
+        The positions only change with the map size, so they are computed
+        once here instead of for every room on every render.
 
         Args:
-            surface: Pygame surface for rendering
-            x, y: Room grid coordinates
+            rect: Map area, at the origin
             room_width, room_height: Dimensions of each room
             offset_x, offset_y: Positioning offsets
-            hero_pos: Current player location
-        """
-        room = self.dungeon.get_room(x, y)
-        room_rect = pygame.Rect(
-            offset_x + x * room_width,
-            offset_y + y * room_height,
-            room_width,
-            room_height
-        )
 
-        # Determine room color based on content/status
-        if (x, y) == hero_pos:
-            color = self.CURRENT
-        elif (x, y) == self.dungeon.entrance:
-            color = self.ENTRANCE
-        elif (x, y) == self.dungeon.exit:
-            color = self.EXIT
-        else:
-            color = self.ROOM_BG if room.visited else self.UNEXPLORED
+        Returns:
+            tuple: One row per maze row of (topleft, limit) pairs, where
+                   limit is the area the room's labels may cover (see
+                   _draw_contents): up to the room's right and bottom
+                   edges, or the map's for the last column and row
+        """
+        width, height = self.dungeon.size
+        layout = []
+        for y in range(height):
+            top = offset_y + y * room_height
+            bottom = top + room_height if y < height - 1 else rect.bottom
+            cells = []
+            for x in range(width):
+                left = offset_x + x * room_width
+                right = left + room_width if x < width - 1 else rect.right
+                limit = pygame.Rect(rect.left, rect.top, right - rect.left, bottom - rect.top)
+                cells.append(((left, top), limit))
+            layout.append(tuple(cells))
+        return tuple(layout)
+
+    def _room_backgrounds(self) -> list:
+        """
+        Pick every room's background tile, with doors for visited rooms.
 
-        # Draw the room
-        pygame.draw.rect(surface, color, room_rect)
-        pygame.draw.rect(surface, self.BORDER, room_rect, 1)
+        Tiles are shared between rooms in the same state, so comparing
+        them by identity tells which rooms changed since the last call.
 
-        # Only draw details for visited rooms or the player's current room
-        if not room.visited and (x, y) != hero_pos:
-            return
+        Returns:
+            list: (tile, position) pairs, one per room in row order
+        """
+        # Everything the room loop reads, looked up once
+        # (-1, -1) never matches a room, for dungeons without an entrance or exit
+        entrance_x, entrance_y = self.dungeon.entrance or (-1, -1)
+        exit_x, exit_y = self.dungeon.exit or (-1, -1)
+        room_tile = self._room_tile
+        unexplored_tile = self._room_tiles[self.UNEXPLORED]
+        is_visited = self.dungeon.is_visited
+
+        tiles = []
+        for y, (row, cells) in enumerate(zip(self.dungeon.maze, self._layout)):
+            for x, room in enumerate(row):
+                # Determine room color based on status; doors only show
+                # for visited rooms
+                visited = is_visited(x, y)
+                door_mask = room.door_mask() if visited else 0
+                if x == entrance_x and y == entrance_y:
+                    tile = room_tile(self.ENTRANCE, door_mask)
+                elif x == exit_x and y == exit_y:
+                    tile = room_tile(self.EXIT, door_mask)
+                elif visited:
+                    tile = room_tile(self.ROOM_BG, door_mask)
+                else:
+                    tile = unexplored_tile
+                tiles.append((tile, cells[x][0]))
+        return tiles
+
+    def _draw_current_room(self, layers, room, pos, room_rect, limit):
+        """
+        Queue the player's current room with its doors, contents and marker.
+
+        Every other room's background and doors are in the base layer,
+        and visited rooms only add their contents on top of it.
 
-        # Draw doors for visited rooms
-        for direction, has_door in room.doors.items():
-            if has_door:
-                self.draw_door(surface, room_rect, direction)
-
-        # Draw room contents
-        center_x = room_rect.centerx
-        center_y = room_rect.centery
-        font = self.font
-
-        # Check if this is a pillar room
-        is_pillar_room = False
-        for pillar, px, py in self.pillar_locations:
-            if (x, y) == (px, py):
-                is_pillar_room = True
-                # Draw pillar in gold
-                pillar_text = font.render(pillar, True, BLACK)
-                pillar_rect = pillar_text.get_rect(center=(center_x, center_y))
-                pygame.draw.rect(surface, self.PILLAR, pillar_rect.inflate(6, 6))
-                surface.blit(pillar_text, pillar_rect)
-                break
-
-        # Draw other room contents if not a pillar room
-        if not is_pillar_room:
-            # Draw monster with skull emoji
-            if room.monster and room.monster.is_alive:
-                monster_text = font.render("☠", True, self.MONSTER)
-                monster_rect = monster_text.get_rect(center=(center_x, center_y))
-                surface.blit(monster_text, monster_rect)
-
-            # Draw pit with spike emoji
-            elif room.hasPit:
-                pit_text = font.render("⚡", True, self.TRAP)
-                pit_rect = pit_text.get_rect(center=(center_x, center_y))
-                surface.blit(pit_text, pit_rect)
-
-            # Draw potions
-            elif room.hasHealthPot and room.hasVisionPot:
-                potion_text = font.render("HP", True, WHITE)
-                surface.blit(potion_text, (center_x - 10, center_y - 8))
-                potion_text = font.render("VP", True, WHITE)
-                surface.blit(potion_text, (center_x - 10, center_y + 8))
-            elif room.hasHealthPot:
-                potion_text = font.render("HP", True, WHITE)
-                potion_rect = potion_text.get_rect(center=(center_x, center_y))
-                surface.blit(potion_text, potion_rect)
-            elif room.hasVisionPot:
-                potion_text = font.render("VP", True, WHITE)
-                potion_rect = potion_text.get_rect(center=(center_x, center_y))
-                surface.blit(potion_text, potion_rect)
+        Content Rendering Hierarchy:
+        1. Draw the room in the current room color, with its doors
+        2. Display special contents (pillars, monsters, items)
+        3. Add the player marker
+
+        Args:
+            layers: (surface, position[, area]) entries the room's pieces
+                    are appended to, in drawing order
+            room: The room the player is in
+            pos: Room grid coordinates (x, y)
+            room_rect: Rectangle the room occupies on the map
+            limit: Area the room's labels may cover, see _draw_contents
+        """
+        layers.append((self._room_tile(self.CURRENT, room.door_mask()), room_rect.topleft))
+        self._draw_contents(layers, room, pos, room_rect, limit)
 
         # Draw player marker on top of everything else
-        if (x, y) == hero_pos:
-            self.draw_player_marker(surface, room_rect)
+        layers.append((self._marker_tile, room_rect.topleft))
+
+    def _draw_contents(self, layers, room, pos, room_rect, limit):
+        """
+        Queue the label for a room's most notable content.
+
+        Labels can be larger than small rooms. Rooms used to be drawn one
+        after another, so the rooms to the right and below painted over
+        any overhang; labels are cut off at the same edges via limit.
+
+        Args:
+            layers: (surface, position[, area]) entries to append to
+            room: The room whose contents are drawn
+            pos: Room grid coordinates (x, y)
+            room_rect: Rectangle the room occupies on the map; the caller
+                       reuses it for the next room, so it isn't kept
+            limit: Area the labels may cover
+        """
+        center = room_rect.center
+        glyphs = self._glyphs
+
+        # Pillar rooms show only the pillar; other rooms show their most
+        # notable content
+        pillar = self._pillar_by_pos.get(pos)
+        if pillar is not None:
+            # Draw pillar in gold
+            pillar_tile = self._pillar_tile(pillar)
+            labels = ((pillar_tile, pillar_tile.get_rect(center=center)),)
+
+        # Draw monster with skull emoji
+        elif room.monster and room.monster.is_alive:
+            monster_text = glyphs["☠"]
+            labels = ((monster_text, monster_text.get_rect(center=center)),)
+
+        # Draw pit with spike emoji
+        elif room.hasPit:
+            pit_text = glyphs["⚡"]
+            labels = ((pit_text, pit_text.get_rect(center=center)),)
+
+        # Draw potions
+        elif room.hasHealthPot and room.hasVisionPot:
+            center_x, center_y = center
+            labels = ((glyphs["HP"], glyphs["HP"].get_rect(topleft=(center_x - 10, center_y - 8))),
+                      (glyphs["VP"], glyphs["VP"].get_rect(topleft=(center_x - 10, center_y + 8))))
+        elif room.hasHealthPot:
+            potion_text = glyphs["HP"]
+            labels = ((potion_text, potion_text.get_rect(center=center)),)
+        elif room.hasVisionPot:
+            potion_text = glyphs["VP"]
+            labels = ((potion_text, potion_text.get_rect(center=center)),)
+        else:
+            return
+
+        for label, label_rect in labels:
+            if limit.contains(label_rect):
+                layers.append((label, label_rect))
+            else:
+                visible = label_rect.clip(limit)
+                layers.append((label, visible, visible.move(-label_rect.x, -label_rect.y)))
 
     def _log_debug_info(self, hero_pos):
         """
         Generate detailed debug information about the current room.
 
+        Called when the map is re-rendered rather than every frame, so
+        standing still doesn't repeat the same report.
+
         Provides comprehensive logging that:
         - Prints player location
         - Details room contents
@@ -345,15 +687,18 @@ class MiniMap:
         Args:
             hero_pos: Current player location coordinates
         """
-        print(f"\nPlayer at {hero_pos}")
+        lines = [f"\nPlayer at {hero_pos}"]
         room = self.dungeon.get_room(*hero_pos)
         if room.hasPillar:
-            print(f"Room contains pillar: {room.pillarType}")
+            lines.append(f"Room contains pillar: {room.pillarType}")
         if room.hasHealthPot:
-            print("Room contains health potion")
+            lines.append("Room contains health potion")
         if room.hasVisionPot:
-            print("Room contains vision potion")
+            lines.append("Room contains vision potion")
         if room.hasPit:
-            print("Room contains pit")
+            lines.append("Room contains pit")
         if room.monster:
-            print(f"Room contains monster: {room.monster.name}")
\ No newline at end of file
+            lines.append(f"Room contains monster: {room.monster.name}")
+
+        # One write for the whole report
+        print("\n".join(lines))
\ No newline at end of file
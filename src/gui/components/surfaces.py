@@ -0,0 +1,26 @@
+import pygame
+
+
+def to_display_format(surface: pygame.Surface, alpha: bool = False) -> pygame.Surface:
+    """
+    Convert a surface to the display's pixel format, if there is one.
+
+    Blitting a surface that already matches the display format is a
+    straight copy; an unconverted one is converted pixel by pixel on
+    every blit. Without a display mode (e.g. headless tests) the
+    surface is returned as is.
+
+    Args:
+        surface (pygame.Surface): Surface to convert
+        alpha (bool): Keep per-pixel alpha, as antialiased text and
+                      shapes with transparent surroundings need
+
+    Returns:
+        pygame.Surface: The converted surface
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    try:
+        return surface.convert_alpha() if alpha else surface.convert()
+    except pygame.error:
+        return surface
@@ -3,8 +3,8 @@ from typing import Optional, List
 import random
 
 from .constants import *
-from .components import EventLog, StatsDisplay, MiniMap, CombatUI
-from .components.first_person_view import FirstPersonView
+from .components import EventLog, StatsDisplay, MiniMap, CombatUI, FirstPersonView
+from .components.fonts import get_font
 from src.combat.combat_system import CombatSystem
 from ..database.sqlite_dungeon_configuration import SqliteDungeonConfiguration
 from ..database.sqlite_hero_configuration import SqliteHeroConfiguration
@@ -89,6 +89,12 @@ class GameWindow:
         self.death_screen_shown = False
         self.final_death_screen = None
 
+        # Whether the display holds a complete exploration frame, so the
+        # next one only has to push the areas that changed
+        self._exploration_shown = False
+        # Facing shown by the compass on screen
+        self._compass_direction = None
+
         # Define component rectangles
         self._init_layout()
 
@@ -159,6 +165,11 @@ class GameWindow:
         if event.type == pygame.QUIT:
             return False
 
+        # The window was uncovered; parts of it may need repainting
+        if event.type == pygame.WINDOWEXPOSED:
+            self._exploration_shown = False
+            return True
+
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 return False
@@ -365,7 +376,7 @@ class GameWindow:
         self.event_log.add_message(f"Combat started with {monster.name}!", "combat", True)
 
         # Clear previous combat messages
-        self.combat_ui.combat_messages = []
+        self.combat_ui.clear_combat_messages()
         self.combat_ui.add_combat_message(f"Combat started with {monster.name}!")
 
     def end_combat(self, victor):
@@ -550,8 +561,28 @@ class GameWindow:
         3. Render appropriate view
         4. Update display
         5. Optional debug logging
+
+        During combat only the screen regions the combat UI reports as
+        changed are pushed to the display. Exploration frames after the
+        first are drawn over the previous one, and only the changed
+        areas are pushed too.
         """
+        if self.in_combat and self.combat_system and not self.victory:
+            self._exploration_shown = False
+            dirty_rects = self._draw_combat_screen()
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+            return
+
+        if self._exploration_shown and not self.in_combat and not self.victory:
+            dirty_rects = self._draw_normal_screen(hero, debug_log_minimap)
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+            return
+
         self.screen.fill(BLACK)
+        self.first_person_view.invalidate()
+        self.minimap.invalidate()
 
         if self.in_combat and self.combat_system:
             self._draw_combat_screen()
@@ -561,6 +592,10 @@ class GameWindow:
         if self.victory:
             self._draw_victory_screen()
 
+        # The full repaint covered the combat screen, so the next combat
+        # frame has to start from scratch
+        self.combat_ui.invalidate()
+        self._exploration_shown = not self.in_combat and not self.victory
         pygame.display.flip()
 
     def _draw_normal_screen(self, hero, debug_log_minimap):
@@ -570,17 +605,31 @@ class GameWindow:
         Args:
             hero: The player character
             debug_log_minimap: Whether to log minimap debug info
-        """
-        # Draw first-person view in the main area
-        self.first_person_view.draw(self.screen, self.dungeon, hero.location, self.hero_direction)
+
+        Returns:
+            List[pygame.Rect]: Screen areas that changed
+        """
+        # Draw first-person view in the main area, with the directional
+        # indicators at the bottom of it; both stay on screen until the
+        # view changes. Rooms can look the same from two sides, so turning
+        # always redraws the view under the new compass
+        if self.hero_direction != self._compass_direction:
+            self.first_person_view.invalidate()
+            self._compass_direction = self.hero_direction
+        dirty_rects = self.first_person_view.draw(self.screen, self.dungeon,
+                                                  hero.location, self.hero_direction)
+        if dirty_rects:
+            self._draw_direction_indicator()
 
         # Draw side panel UI components
-        self.minimap.draw(self.screen, self.minimap_rect, hero.location, debug_log_minimap)
+        dirty_rects += self.minimap.draw(self.screen, self.minimap_rect, hero.location,
+                                         debug_log_minimap)
         self.event_log.draw(self.screen, self.log_rect)
+        dirty_rects += self.event_log.consume_dirty()
         self.stats_display.draw(self.screen, self.stats_rect, hero)
+        dirty_rects.append(self.stats_rect)
 
-        # Draw directional indicators at the bottom of the screen
-        self._draw_direction_indicator()
+        return dirty_rects
 
     def _draw_direction_indicator(self):
         """Draw a compass showing which direction the player is facing."""
@@ -594,7 +643,6 @@ class GameWindow:
         pygame.draw.circle(self.screen, (200, 200, 200), (x, y), radius, 2)
 
         # Draw direction letters
-        font = pygame.font.Font(None, 24)
         directions = {
             'N': (x, y - radius + 10),
             'E': (x + radius - 10, y),
@@ -606,15 +654,15 @@ class GameWindow:
             # Current direction is highlighted
             color = (255, 255, 0) if dir_letter == self.hero_direction else (150, 150, 150)
             size = 28 if dir_letter == self.hero_direction else 24
-            dir_font = pygame.font.Font(None, size)
+            dir_font = get_font(None, size)
 
             text = dir_font.render(dir_letter, True, color)
             text_rect = text.get_rect(center=pos)
             self.screen.blit(text, text_rect)
 
     def _draw_combat_screen(self):
-        """Draw the combat interface."""
-        self.combat_ui.draw_combat_screen(
+        """Draw the combat interface and return the areas that changed."""
+        return self.combat_ui.draw_combat_screen(
             self.screen,
             self.hero,
             self.combat_system.monster,
@@ -628,7 +676,7 @@ class GameWindow:
         overlay.set_alpha(192)
         self.screen.blit(overlay, (0, 0))
 
-        font = pygame.font.Font(None, 64)
+        font = get_font(None, 64)
         text = font.render("Victory!", True, (255, 215, 0))
         text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
         self.screen.blit(text, text_rect)
@@ -647,6 +695,7 @@ class GameWindow:
         2. Animated text rendering
         3. Provide player action options
         """
+        self._exploration_shown = False
         if not self.death_screen_shown:
             self._create_death_screen()
         else:
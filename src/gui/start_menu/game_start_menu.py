@@ -59,13 +59,11 @@ class GameMenu:
            - Enables start button only when all requirements met
         """
         self.screen = screen
-        self.save_data = save_data
         self.font_large = pygame.font.Font(None, 64)  # Title
         self.font_medium = pygame.font.Font(None, 36)  # Hero names, buttons
         self.font_small = pygame.font.Font(None, 24)   # Descriptions
 
-        # Menu state
-        self.selected_hero = None
+        # Hero choices
         self.hero_options = [
             {
                 "class": "Warrior",
@@ -108,19 +106,41 @@ class GameMenu:
             }
         ]
 
+        # Clickable areas, laid out when the menu is drawn
+        self.name_input_rect = None
+        self.easy_rect = None
+        self.hard_rect = None
+        self.load_rect = None
+        self.start_rect = None
+
+        self.reset(save_data)
+
+    def reset(self, save_data):
+        """
+        Return the menu to its initial, nothing-selected state.
+
+        Clears the player's selections so the same menu (and its loaded
+        fonts) can be shown again after a game ends, instead of building
+        a new one.
+
+        Args:
+            save_data: Saved game available to load, or None
+        """
+        self.save_data = save_data
+
+        # Menu state
+        self.selected_hero = None
+        for hero in self.hero_options:
+            hero["hovered"] = False
+
         # Input fields
         self.player_name = ""
-        self.name_input_rect = None
         self.name_input_active = False
 
         # Difficulty selection
         self.selected_difficulty = None
-        self.easy_rect = None
-        self.hard_rect = None
 
         # Start button
-        self.load_rect = None
-        self.start_rect = None
         self.can_start = False
 
     def handle_event(self, event):
@@ -0,0 +1,112 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.gui.components.combat_ui import CombatUI
+from src.gui.constants import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.characters.heroes.warrior import Warrior
+from src.characters.monsters.ogre import Ogre
+
+
+class TestCombatUI(unittest.TestCase):
+    def setUp(self):
+        """Set up a headless screen, combat UI and combatants."""
+        pygame.init()
+        self.screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.combat_ui = CombatUI()
+        self.hero = Warrior("TestHero")
+        self.monster = Ogre(200, 30, 60, 2, 0.6, 0.1, 30, 60)
+
+    def test_buttons_positioned_before_first_draw(self):
+        """Test that buttons can be clicked without drawing the screen first."""
+        attack = self.combat_ui.action_buttons['attack']
+        self.assertEqual(self.combat_ui.handle_click(attack.center), 'attack')
+
+    def test_render_reuses_surfaces(self):
+        """Test that identical text is rasterized once."""
+        first = self.combat_ui._render("HP: 10/20")
+        self.assertIs(self.combat_ui._render("HP: 10/20"), first)
+        self.assertIsNot(self.combat_ui._render("HP: 9/20"), first)
+
+    def test_render_cache_is_bounded(self):
+        """Test that the text cache evicts the least recently used entry."""
+        self.combat_ui.max_cached_texts = 2
+        first = self.combat_ui._render("a")
+        self.combat_ui._render("b")
+        self.combat_ui._render("a")
+        self.combat_ui._render("c")
+
+        self.assertEqual(len(self.combat_ui._text_cache), 2)
+        self.assertIs(self.combat_ui._render("a"), first)
+        self.assertNotIn(("b", (255, 255, 255)), self.combat_ui._text_cache)
+
+    def test_hp_label_reuses_surfaces(self):
+        """Test that HP labels are rendered once per health value."""
+        first = self.combat_ui._hp_label(10, 20)
+        self.assertIs(self.combat_ui._hp_label(10, 20), first)
+        self.assertIsNot(self.combat_ui._hp_label(9, 20), first)
+
+    def test_name_label_reuses_surfaces(self):
+        """Test that fighter name labels are rendered once per name."""
+        first = self.combat_ui._name_label("TestHero", "Warrior")
+        self.assertIs(self.combat_ui._name_label("TestHero", "Warrior"), first)
+        self.assertIsNot(self.combat_ui._name_label("TestHero"), first)
+
+    def test_combat_log_keeps_latest_messages(self):
+        """Test that the combat log is bounded and shows the newest lines."""
+        for i in range(8):
+            self.combat_ui.add_combat_message(f"message {i}")
+
+        self.assertEqual(len(self.combat_ui.combat_messages), self.combat_ui.max_combat_messages)
+        self.assertEqual(self.combat_ui._recent_messages(),
+                         ("message 4", "message 5", "message 6", "message 7"))
+
+        self.combat_ui.clear_combat_messages()
+        self.assertEqual(len(self.combat_ui.combat_messages), 0)
+        self.assertEqual(self.combat_ui._recent_messages(), ())
+
+    def test_health_bar_fill(self):
+        """Test that the health bar fill matches the remaining health."""
+        self.combat_ui._draw_health_bar(self.screen, (50, 280), 50, 200)
+
+        self.assertEqual(self.combat_ui._hp_bar_fill.width, 50)
+        self.assertEqual(self.screen.get_at((60, 290))[:3], (255, 0, 0))
+        self.assertEqual(self.screen.get_at((160, 290))[:3], (64, 0, 0))
+
+    def test_draw_combat_screen(self):
+        """Test that the combat screen draws across repeated frames."""
+        self.combat_ui.add_combat_message("Combat started!")
+        for _ in range(2):
+            self.combat_ui.draw_combat_screen(self.screen, self.hero, self.monster, 'attack')
+
+        self.assertIn(("Combat started!", (255, 255, 255)), self.combat_ui._text_cache)
+        self.assertEqual(self.screen.get_at((5, 5))[:3], (20, 20, 20))
+
+
+    def test_draw_combat_screen_dirty_regions(self):
+        """Test that only changed regions are repainted after the first frame."""
+        ui = self.combat_ui
+        first = ui.draw_combat_screen(self.screen, self.hero, self.monster)
+        self.assertEqual(first, [self.screen.get_rect()])
+
+        # Nothing changed, nothing to repaint
+        self.assertEqual(ui.draw_combat_screen(self.screen, self.hero, self.monster), [])
+
+        self.monster.hp -= 10
+        ui.add_combat_message("Hit!")
+        dirty = ui.draw_combat_screen(self.screen, self.hero, self.monster, 'attack')
+        self.assertEqual(dirty, [ui._regions['monster'], ui._regions['log'], ui._regions['attack']])
+
+        # Moving the selection repaints just the two buttons involved
+        dirty = ui.draw_combat_screen(self.screen, self.hero, self.monster, 'potion')
+        self.assertEqual(dirty, [ui.action_buttons['attack'], ui.action_buttons['potion']])
+
+        ui.invalidate()
+        self.assertEqual(ui.draw_combat_screen(self.screen, self.hero, self.monster, 'attack'),
+                         [self.screen.get_rect()])
+
+
+if __name__ == '__main__':
+    unittest.main()
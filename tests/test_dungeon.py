@@ -0,0 +1,86 @@
+import unittest
+from src.dungeon.dungeon import Dungeon
+from src.characters.heroes.warrior import Warrior
+
+
+class TestDungeon(unittest.TestCase):
+    def setUp(self):
+        """Set up an empty test dungeon."""
+        self.dungeon = Dungeon(size=(4, 3))
+
+    def test_mark_visited(self):
+        """Test that marking a room visited is reflected in the dungeon."""
+        self.dungeon.mark_visited(3, 1)
+
+        self.assertTrue(self.dungeon.is_visited(3, 1))
+        self.assertFalse(self.dungeon.is_visited(1, 1))
+        self.assertEqual(list(self.dungeon.get_visible_rooms()), [(3, 1)])
+        self.assertEqual(self.dungeon.visited_state(), bytes([0] * 7 + [1] + [0] * 4))
+
+    def test_visited_version(self):
+        """Test that the visited version changes only when visited rooms change."""
+        version = self.dungeon.visited_version
+        self.dungeon.mark_visited(0, 0)
+        self.assertNotEqual(self.dungeon.visited_version, version)
+
+        version = self.dungeon.visited_version
+        self.dungeon.mark_visited(0, 0)
+        self.assertEqual(self.dungeon.visited_version, version)
+
+        self.dungeon.clear_visited()
+        self.assertNotEqual(self.dungeon.visited_version, version)
+
+        # Rooms can't be marked behind the dungeon's back
+        with self.assertRaises(AttributeError):
+            self.dungeon.get_room(1, 1).visited = True
+
+    def test_reveal_adjacent_rooms(self):
+        """Test that revealed rooms are reported as visible."""
+        revealed = self.dungeon.reveal_adjacent_rooms((0, 0))
+
+        self.assertEqual(sorted(revealed), [(0, 1), (1, 0), (1, 1)])
+        self.assertEqual(sorted(self.dungeon.get_visible_rooms()), sorted(revealed))
+
+    def test_clear_visited(self):
+        """Test that clearing visited state hides every room again."""
+        self.dungeon.reveal_adjacent_rooms((1, 1))
+        self.dungeon.clear_visited()
+
+        self.assertEqual(self.dungeon.get_visible_rooms(), {})
+        self.assertFalse(self.dungeon.is_visited(0, 0))
+
+    def test_str_hides_unvisited_rooms(self):
+        """Test that only visited rooms show their contents in the text map."""
+        self.dungeon.mark_visited(0, 0)
+        text_rows = str(self.dungeon).split('\n')
+
+        self.assertEqual(text_rows[1].count('?'), self.dungeon.size[0] - 1)
+
+
+    def test_move_hero(self):
+        """Test that the hero moves only through doors open on both sides."""
+        hero = Warrior("TestHero")
+        hero.location = (0, 0)
+
+        success, _, _ = self.dungeon.move_hero(hero, 'E')
+        self.assertFalse(success)
+
+        self.dungeon.get_room(0, 0).doors['E'] = True
+        success, _, _ = self.dungeon.move_hero(hero, 'E')
+        self.assertFalse(success)
+        self.assertEqual(hero.location, (0, 0))
+
+        self.dungeon.get_room(1, 0).doors['W'] = True
+        success, _, _ = self.dungeon.move_hero(hero, 'E')
+        self.assertTrue(success)
+        self.assertEqual(hero.location, (1, 0))
+        self.assertTrue(self.dungeon.is_visited(1, 0))
+
+        # Doors leading off the grid never move the hero
+        self.dungeon.get_room(1, 0).doors['N'] = True
+        success, _, _ = self.dungeon.move_hero(hero, 'N')
+        self.assertFalse(success)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from src.game.dungeon_game import DungeonGame
+from src.game.game_state import GameState
+
+
+class TestDungeonGameEvents(unittest.TestCase):
+    def setUp(self):
+        """Set up a headless game on its start menu."""
+        pygame.init()
+        self.game = DungeonGame()
+        self.game.update_event_filter()
+        pygame.event.clear()
+
+    def test_menu_name_field_receives_typed_keys(self):
+        """Test that typing on the menu reaches the name field."""
+        self.assertFalse(pygame.event.get_blocked(pygame.TEXTINPUT))
+        self.assertFalse(pygame.event.get_blocked(pygame.TEXTEDITING))
+
+        self.game.menu.name_input_active = True
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, unicode="a", mod=0))
+        self.assertTrue(self.game.handle_menu(pygame.event.get()))
+        self.assertEqual(self.game.menu.player_name, "a")
+
+    def test_mouse_motion_blocked_only_while_playing(self):
+        """Test that mouse motion reaches the menu but not gameplay."""
+        self.assertFalse(pygame.event.get_blocked(pygame.MOUSEMOTION))
+        self.assertTrue(pygame.event.get_blocked(pygame.WINDOWMOVED))
+
+        self.game.state = GameState.PLAYING
+        self.game.update_event_filter()
+        self.assertTrue(pygame.event.get_blocked(pygame.MOUSEMOTION))
+        self.assertFalse(pygame.event.get_blocked(pygame.TEXTINPUT))
+
+        self.game.state = GameState.MENU
+        self.game.update_event_filter()
+        self.assertFalse(pygame.event.get_blocked(pygame.MOUSEMOTION))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -72,12 +72,40 @@ def test_dungeon_population():
         for y in range(min(3, size[1])):
             for x in range(min(3, size[0])):
                 room = dungeon.get_room(x, y)
-                room.visited = True  # So we can see contents
+                dungeon.mark_visited(x, y)  # So we can see contents
                 print(f"\nRoom ({x}, {y}):")
-                print(str(room))
+                print(room.ascii_art(dungeon.is_visited(x, y)))
                 if room.monster:
                     print(f"Contains: {room.monster}")
 
 
+def test_create_is_silent_until_render(capsys):
+    """Creating a dungeon does not print the layout; render() does."""
+    dungeon = EasyDungeonFactory().create()
+    assert "=== Dungeon Layout ===" not in capsys.readouterr().out
+
+    dungeon.render()
+    out = capsys.readouterr().out
+    assert "=== Dungeon Layout ===" in out
+    assert out.count("\n+") == dungeon.size[1] + 1
+
+
+def test_validate_connections_closes_one_sided_doors():
+    """A door only one of two neighboring rooms has is closed on both sides."""
+    factory = EasyDungeonFactory()
+    dungeon = factory.create()
+    dungeon.maze[2][3].doors['E'] = True
+    dungeon.maze[2][4].doors['W'] = False
+    dungeon.maze[5][4].doors['N'] = True
+    dungeon.maze[4][4].doors['S'] = False
+
+    factory.validate_connections()
+
+    assert not dungeon.maze[2][3].doors['E']
+    assert not dungeon.maze[2][4].doors['W']
+    assert not dungeon.maze[5][4].doors['N']
+    assert not dungeon.maze[4][4].doors['S']
+
+
 if __name__ == "__main__":
     test_dungeon_population()
\ No newline at end of file
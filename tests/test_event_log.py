@@ -0,0 +1,92 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.gui.components.event_log import EventLog
+from src.gui.constants import DARK_GRAY
+
+
+class TestEventLog(unittest.TestCase):
+    def setUp(self):
+        """Set up a headless event log."""
+        pygame.init()
+        self.event_log = EventLog(max_messages=3)
+
+    def test_messages_are_bounded(self):
+        """Test that the oldest messages are dropped once the log is full."""
+        for i in range(5):
+            self.event_log.add_message(f"message {i}")
+
+        self.assertEqual([msg['text'] for msg in self.event_log.messages],
+                         ["message 2", "message 3", "message 4"])
+
+    def test_message_colors(self):
+        """Test that messages get their type's color, or the default."""
+        self.event_log.add_message("Hit!", "combat")
+        self.event_log.add_message("Hello", "unknown")
+
+        self.assertEqual(self.event_log.messages[0]['color'], self.event_log.colors['combat'])
+        self.assertEqual(self.event_log.messages[1]['color'], self.event_log.colors['default'])
+
+    def test_wrap(self):
+        """Test that long messages wrap to the log width."""
+        text = "You hit the ogre with a mighty swing of your sword"
+        lines = self.event_log._wrap(text, 120)
+
+        self.assertGreater(len(lines), 1)
+        self.assertEqual(' '.join(lines), text)
+        for line in lines:
+            self.assertLessEqual(self.event_log.font.size(line)[0], 120)
+
+    def test_draw_caches_wrapped_lines(self):
+        """Test that a message is wrapped and rendered once across frames."""
+        surface = pygame.Surface((300, 100))
+        self.event_log.add_message("Found a health potion!", "item")
+        self.event_log.draw(surface, surface.get_rect())
+        line_surfs = self.event_log.messages[0]['_line_surfs']
+
+        self.event_log.draw(surface, surface.get_rect())
+        self.assertIs(self.event_log.messages[0]['_line_surfs'], line_surfs)
+
+    def test_draw_reuses_composite_until_changed(self):
+        """Test that the log is only recomposited after it changes."""
+        surface = pygame.Surface((300, 100))
+        self.event_log.add_message("Moved N", "movement")
+        self.event_log.draw(surface, surface.get_rect())
+        self.assertFalse(self.event_log._dirty)
+
+        self.event_log.scroll_position = 0
+        self.assertFalse(self.event_log._dirty)
+
+        self.event_log.add_message("Moved S", "movement")
+        self.assertTrue(self.event_log._dirty)
+        self.event_log.draw(surface, surface.get_rect())
+        self.assertFalse(self.event_log._dirty)
+
+        self.event_log.scroll_position = 1
+        self.assertTrue(self.event_log._dirty)
+
+    def test_consume_dirty(self):
+        """Test that only draws that changed the log report a dirty rect."""
+        surface = pygame.Surface((300, 100))
+        rect = surface.get_rect()
+        self.event_log.add_message("Moved N", "movement")
+        self.event_log.draw(surface, rect)
+        self.assertEqual(self.event_log.consume_dirty(), [rect])
+
+        self.event_log.draw(surface, rect)
+        self.assertEqual(self.event_log.consume_dirty(), [])
+
+    def test_draw(self):
+        """Test that the log draws its visible messages."""
+        surface = pygame.Surface((300, 100))
+        self.event_log.add_message("Moved N", "movement")
+        self.event_log.draw(surface, surface.get_rect())
+
+        self.assertEqual(surface.get_at((299, 50))[:3], DARK_GRAY)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.gui.components.first_person_view import FirstPersonView
+from src.dungeon.dungeon import Dungeon
+
+
+class TestFirstPersonView(unittest.TestCase):
+    def setUp(self):
+        """Set up a headless view over a small empty dungeon."""
+        pygame.init()
+        self.surface = pygame.Surface((600, 480))
+        self.view = FirstPersonView(pygame.Rect(0, 0, 600, 480))
+        self.dungeon = Dungeon(size=(3, 3))
+
+    def test_draw_corridor(self):
+        """Test that the corridor shows ceiling, floor and walls."""
+        self.view.draw(self.surface, self.dungeon, (1, 1), 'N')
+
+        self.assertEqual(self.surface.get_at((300, 20))[:3], self.view.CEILING_COLOR)
+        self.assertEqual(self.surface.get_at((300, 460))[:3], self.view.FLOOR_COLOR)
+        self.assertEqual(self.surface.get_at((20, 240))[:3], self.view.WALL_COLOR)
+        self.assertEqual(self.surface.get_at((300, 240))[:3], (0, 0, 0))
+
+    def test_corridor_rendered_once(self):
+        """Test that the corridor is reused until the view is resized."""
+        self.view.draw(self.surface, self.dungeon, (1, 1), 'N')
+        corridor = self.view._corridor_cache
+        self.view.draw(self.surface, self.dungeon, (1, 1), 'E')
+        self.assertIs(self.view._corridor_cache, corridor)
+
+        self.view.rect = pygame.Rect(0, 0, 400, 300)
+        self.view.draw(self.surface, self.dungeon, (1, 1), 'E')
+        self.assertIsNot(self.view._corridor_cache, corridor)
+        self.assertEqual(self.view._corridor_cache.get_size(), (400, 300))
+
+    def test_resize(self):
+        """Test that resizing rebuilds the size-dependent caches."""
+        self.view.draw(self.surface, self.dungeon, (1, 1), 'N')
+        self.view.resize(pygame.Rect(0, 0, 400, 300))
+
+        self.assertIsNone(self.view._corridor_cache)
+        self.assertEqual(len(self.view._shells), 0)
+        self.assertEqual(len(self.view._views), 0)
+        self.assertEqual(self.view._left_wall_poly[3], (0, 300))
+        self.assertEqual(self.view.draw(self.surface, self.dungeon, (1, 1), 'N'),
+                         [pygame.Rect(0, 0, 400, 300)])
+        self.assertEqual(self.view._corridor_cache.get_size(), (400, 300))
+
+        # Moving without resizing keeps the caches but blits at the new spot
+        corridor = self.view._corridor_cache
+        self.view.resize(pygame.Rect(100, 50, 400, 300))
+        self.assertIs(self.view._corridor_cache, corridor)
+        self.assertEqual(self.view.draw(self.surface, self.dungeon, (1, 1), 'N'),
+                         [pygame.Rect(100, 50, 400, 300)])
+
+    def test_view_redrawn_only_when_room_changes(self):
+        """Test that an unchanged room reuses the composed view."""
+        room = self.dungeon.get_room(1, 1)
+        room.hasHealthPot = True
+        self.view.draw(self.surface, self.dungeon, (1, 1), 'N')
+        key = self.view._shown[0]
+
+        self.view.draw(self.surface, self.dungeon, (1, 1), 'N')
+        self.assertEqual(self.view._shown[0], key)
+
+        room.hasHealthPot = False
+        self.view.draw(self.surface, self.dungeon, (1, 1), 'N')
+        self.assertNotEqual(self.view._shown[0], key)
+        self.assertEqual(self.surface.get_at((150, 380))[:3], self.view.FLOOR_COLOR)
+
+    def test_recent_views_are_kept(self):
+        """Test that turning back to a recent view reuses its surface."""
+        self.dungeon.get_room(1, 1).doors['N'] = True
+        self.view.draw(self.surface, self.dungeon, (1, 1), 'N')
+        north = self.view._views[self.view._shown[0]]
+        self.view.draw(self.surface, self.dungeon, (1, 1), 'E')
+        self.view.draw(self.surface, self.dungeon, (1, 1), 'N')
+        self.assertIs(self.view._views[self.view._shown[0]], north)
+
+        # Beyond the limit the oldest view makes room
+        self.view.max_cached_views = 2
+        self.view.draw(self.surface, self.dungeon, (1, 1), 'S')
+        self.assertEqual(len(self.view._views), 2)
+        self.assertEqual(self.surface.get_at((300, 240))[:3], (0, 0, 0))
+
+    def test_draw_returns_dirty_rects(self):
+        """Test that draw reports the view only when it blits something."""
+        self.dungeon.get_room(1, 1).doors['N'] = True
+        self.assertEqual(self.view.draw(self.surface, self.dungeon, (1, 1), 'N'), [self.view.rect])
+        self.assertEqual(self.view.draw(self.surface, self.dungeon, (1, 1), 'N'), [])
+        self.assertEqual(self.view.draw(self.surface, self.dungeon, (1, 1), 'E'), [self.view.rect])
+
+        # After the screen is painted over the view has to be blitted again
+        self.surface.fill((0, 0, 0))
+        self.view.invalidate()
+        self.assertEqual(self.view.draw(self.surface, self.dungeon, (1, 1), 'E'), [self.view.rect])
+        self.assertEqual(self.surface.get_at((300, 20))[:3], self.view.CEILING_COLOR)
+
+        # Outside the dungeon the view is cleared
+        self.assertEqual(self.view.draw(self.surface, self.dungeon, (5, 5), 'E'), [self.view.rect])
+        self.assertEqual(self.surface.get_at((300, 20))[:3], (0, 0, 0))
+
+    def test_text_layers_reuse_labels(self):
+        """Test that a label is rendered once and reused on later frames."""
+        self.view._text_layers("ENTRANCE", (0, 0))
+        label = self.view._text_cache["ENTRANCE"]
+        self.surface.blits(self.view._text_layers("ENTRANCE", (300, 40)))
+
+        self.assertIs(self.view._text_cache["ENTRANCE"], label)
+
+        # Same pixels as rendering the shadow and the text directly
+        expected = pygame.Surface(self.surface.get_size())
+        font = self.view._font
+        shadow = font.render("ENTRANCE", True, (0, 0, 0))
+        expected.blit(shadow, shadow.get_rect(center=(302, 42)))
+        text = font.render("ENTRANCE", True, (255, 255, 255))
+        expected.blit(text, text.get_rect(center=(300, 40)))
+        self.assertEqual(pygame.image.tobytes(self.surface, "RGB"),
+                         pygame.image.tobytes(expected, "RGB"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.gui.components.fonts import get_font
+
+
+class TestGetFont(unittest.TestCase):
+    def setUp(self):
+        """Start each test with a fresh pygame session."""
+        pygame.init()
+
+    def test_font_shared(self):
+        """Test that the same font and size is loaded once."""
+        self.assertIs(get_font(None, 24), get_font(None, 24))
+        self.assertIsNot(get_font(None, 24), get_font(None, 25))
+
+    def test_bold_font_separate(self):
+        """Test that a bold font is cached apart from the regular one."""
+        bold = get_font(None, 24, bold=True)
+
+        self.assertTrue(bold.bold)
+        self.assertFalse(get_font(None, 24).bold)
+        self.assertIsNot(bold, get_font(None, 24))
+
+    def test_font_usable_after_quit_and_init(self):
+        """Test that fonts from a finished pygame session are not handed out again."""
+        first = get_font(None, 24)
+        first.render("x", True, (255, 255, 255))
+
+        for _ in range(2):
+            pygame.quit()
+            self.assertEqual(get_font.cache_info().currsize, 0)
+
+            pygame.init()
+            font = get_font(None, 24)
+            self.assertIsNot(font, first)
+            self.assertGreater(font.render("x", True, (255, 255, 255)).get_width(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.gui.game_window import GameWindow
+from src.dungeon.dungeon import Dungeon
+from src.characters.heroes.warrior import Warrior
+
+
+class TestGameWindowDrawing(unittest.TestCase):
+    def setUp(self):
+        """Set up a headless game window over a small empty dungeon."""
+        pygame.init()
+        self.dungeon = Dungeon(size=(3, 3))
+        self.hero = Warrior("TestHero")
+        self.hero.location = (1, 1)
+        self.dungeon.mark_visited(1, 1)
+        self.window = GameWindow(self.dungeon, [], self.hero)
+
+    def _draw(self):
+        """Draw one frame, returning the mocked flip and update calls."""
+        with mock.patch("pygame.display.flip") as flip, \
+                mock.patch("pygame.display.update") as update:
+            self.window.draw(self.hero)
+        return flip, update
+
+    def test_first_frame_flips_whole_screen(self):
+        """Test that the first exploration frame repaints everything."""
+        flip, update = self._draw()
+        flip.assert_called_once()
+        update.assert_not_called()
+
+    def test_later_frames_update_changed_areas(self):
+        """Test that exploration frames after the first push only changed areas."""
+        self._draw()
+        self.window.event_log.add_message("Moved N", "movement")
+        flip, update = self._draw()
+
+        flip.assert_not_called()
+        self.assertIn(self.window.log_rect, update.call_args[0][0])
+
+        # Neither the log, the view nor the map changed, so none of them
+        # is pushed again
+        flip, update = self._draw()
+        self.assertNotIn(self.window.log_rect, update.call_args[0][0])
+        self.assertNotIn(self.window.main_view_rect, update.call_args[0][0])
+        self.assertNotIn(self.window.minimap_rect, update.call_args[0][0])
+
+        # Turning redraws the view and the compass on it
+        self.window.hero_direction = 'N'
+        flip, update = self._draw()
+        self.assertIn(self.window.main_view_rect, update.call_args[0][0])
+
+    def test_exposed_window_repainted(self):
+        """Test that an uncovered window gets a full repaint."""
+        self._draw()
+        self.window.handle_event(pygame.event.Event(pygame.WINDOWEXPOSED))
+        flip, _ = self._draw()
+        flip.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
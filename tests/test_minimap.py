@@ -0,0 +1,148 @@
+import io
+import os
+import unittest
+from contextlib import redirect_stdout
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.gui.components.minimap import MiniMap
+from src.dungeon.dungeon import Dungeon
+
+
+class TestMiniMap(unittest.TestCase):
+    def setUp(self):
+        """Set up a headless minimap over a small empty dungeon."""
+        pygame.init()
+        self.surface = pygame.Surface((300, 300))
+        self.rect = pygame.Rect(0, 0, 300, 300)
+        self.dungeon = Dungeon(size=(3, 3))
+        self.minimap = MiniMap(self.dungeon, [])
+
+    def test_draw_rooms(self):
+        """Test that the current room is highlighted and others are unexplored."""
+        self.minimap.draw(self.surface, self.rect, (0, 0))
+
+        # 3x3 rooms of 86px centered in the 300px map
+        self.assertEqual(self.surface.get_at((30, 30))[:3], self.minimap.CURRENT)
+        self.assertEqual(self.surface.get_at((150, 150))[:3], self.minimap.UNEXPLORED)
+        self.assertEqual(self.surface.get_at((5, 5))[:3], (32, 32, 32))
+
+    def test_draw_returns_dirty_rects(self):
+        """Test that draw reports the map only when it blits something."""
+        rect = pygame.Rect(40, 50, 200, 150)
+        self.assertEqual(self.minimap.draw(self.surface, rect, (0, 0)), [rect])
+        self.assertEqual(self.minimap.draw(self.surface, rect, (0, 0)), [])
+        self.assertEqual(self.minimap.draw(self.surface, rect, (1, 0)), [rect])
+
+        # After the screen is painted over the map has to be blitted again
+        self.surface.fill((0, 0, 0))
+        self.minimap.invalidate()
+        self.assertEqual(self.minimap.draw(self.surface, rect, (1, 0)), [rect])
+        self.assertNotEqual(self.surface.get_at((45, 55))[:3], (0, 0, 0))
+
+    def test_draw_tiny_map(self):
+        """Test that a map area smaller than its padding just shows the background."""
+        self.minimap.draw(self.surface, pygame.Rect(0, 0, 30, 30), (0, 0))
+        self.assertEqual(self.surface.get_at((15, 15))[:3], (32, 32, 32))
+
+    def test_render_skips_clipped_rooms(self):
+        """Test that rooms outside the clip area are not drawn."""
+        target = pygame.Surface((300, 300))
+        target.set_clip(pygame.Rect(0, 0, 100, 100))
+        self.minimap._render(target, (2, 2))
+
+        self.assertEqual(self.minimap._tile_size, (86, 86))
+        target.set_clip(None)
+        self.assertEqual(target.get_at((30, 30))[:3], self.minimap.UNEXPLORED)
+        self.assertEqual(target.get_at((230, 230))[:3], (0, 0, 0))
+
+    def test_base_layer_kept_while_walking_visited_rooms(self):
+        """Test that moving between seen rooms reuses the base layer."""
+        self.dungeon.reveal_adjacent_rooms((1, 1))
+        self.minimap.draw(self.surface, self.rect, (0, 0))
+        base = self.minimap._base_layer
+
+        self.minimap.draw(self.surface, self.rect, (1, 0))
+        self.assertIs(self.minimap._base_layer, base)
+        self.assertEqual(self.surface.get_at((30, 30))[:3], self.minimap.ROOM_BG)
+        self.assertEqual(self.surface.get_at((110, 30))[:3], self.minimap.CURRENT)
+
+        # Visiting a new room redraws just that room on the same layer
+        self.dungeon.mark_visited(1, 1)
+        self.minimap.draw(self.surface, self.rect, (0, 0))
+        self.assertIs(self.minimap._base_layer, base)
+        self.assertEqual(base.get_at((150, 150))[:3], self.minimap.ROOM_BG)
+
+        # A new map size starts a new layer
+        self.minimap.draw(self.surface, pygame.Rect(0, 0, 200, 200), (0, 0))
+        self.assertIsNot(self.minimap._base_layer, base)
+
+    def test_room_layout(self):
+        """Test that room positions and label limits are worked out once per map size."""
+        self.minimap.draw(self.surface, self.rect, (0, 0))
+        layout = self.minimap._layout
+
+        self.assertEqual(layout[0][0], ((21, 21), pygame.Rect(0, 0, 107, 107)))
+        self.assertEqual(layout[2][2], ((193, 193), pygame.Rect(0, 0, 300, 300)))
+
+        self.minimap.draw(self.surface, self.rect, (1, 0))
+        self.assertIs(self.minimap._layout, layout)
+
+    def test_draw_door(self):
+        """Test that a door bar is drawn on the requested edge only."""
+        self.surface.fill((0, 0, 0))
+        room_rect = pygame.Rect(10, 20, 86, 60)
+        self.minimap.draw_door(self.surface, room_rect, 'E')
+        self.minimap.draw_door(self.surface, room_rect, 'X')
+
+        self.assertEqual(self.surface.get_at((90, 50))[:3], self.minimap.DOOR)
+        self.assertEqual(self.surface.get_at((15, 50))[:3], (0, 0, 0))
+        self.assertIsNone(self.minimap._door_rect(room_rect, 'X'))
+
+    def test_room_tiles_include_doors(self):
+        """Test that room tiles with doors are composited once and reused."""
+        room = self.dungeon.get_room(0, 0)
+        room.doors['E'] = True
+        self.minimap.draw(self.surface, self.rect, (0, 0))
+
+        tile = self.minimap._room_tile(self.minimap.CURRENT, room.door_mask())
+        self.assertIs(self.minimap._room_tile(self.minimap.CURRENT, room.door_mask()), tile)
+        self.assertIs(self.minimap._room_tile(self.minimap.CURRENT, 0),
+                      self.minimap._room_tiles[self.minimap.CURRENT])
+        self.assertEqual(tile.get_at((84, 43))[:3], self.minimap.DOOR)
+
+    def test_map_rendered_only_when_state_changes(self):
+        """Test that the rendered map is reused until something on it changes."""
+        self.minimap.draw(self.surface, self.rect, (0, 0))
+        key = self.minimap._cache_key
+        self.minimap.draw(self.surface, self.rect, (0, 0))
+        self.assertEqual(self.minimap._cache_key, key)
+
+        # Revealing rooms changes the map without the hero moving
+        self.dungeon.reveal_adjacent_rooms((0, 0))
+        self.minimap.draw(self.surface, self.rect, (0, 0))
+        self.assertNotEqual(self.minimap._cache_key, key)
+        self.assertEqual(self.surface.get_at((150, 150))[:3], self.minimap.ROOM_BG)
+
+        # So does picking up an item in the current room
+        key = self.minimap._cache_key
+        self.dungeon.get_room(0, 0).hasHealthPot = True
+        self.minimap.draw(self.surface, self.rect, (0, 0))
+        self.assertNotEqual(self.minimap._cache_key, key)
+
+        self.minimap.invalidate()
+        self.assertIsNone(self.minimap._cache_key)
+
+    def test_debug_log_printed_when_map_changes(self):
+        """Test that the debug report isn't repeated while nothing changes."""
+        self.dungeon.get_room(0, 0).hasPit = True
+        output = io.StringIO()
+        with redirect_stdout(output):
+            for _ in range(3):
+                self.minimap.draw(self.surface, self.rect, (0, 0), debug_log_minimap=True)
+        self.assertEqual(output.getvalue(), "\nPlayer at (0, 0)\nRoom contains pit\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -41,7 +41,7 @@ class TestMovementSystem(unittest.TestCase):
         success = self.dungeon.move_hero(self.hero, 'E')
         self.assertTrue(success)
         self.assertEqual(self.hero.location, (1, 0))
-        self.assertTrue(next_room.visited)
+        self.assertTrue(self.dungeon.is_visited(1, 0))
 
     def test_invalid_movement(self):
         """Test movement through walls."""
@@ -0,0 +1,56 @@
+import unittest
+from src.dungeon.room import Room
+
+
+class TestRoom(unittest.TestCase):
+    def test_populate_from_rolls(self):
+        """Test that pre-drawn rolls below the item chance stock the room."""
+        room = Room()
+        room.populate_from_rolls((0.05, 0.5, 0.0))
+
+        self.assertTrue(room.hasHealthPot)
+        self.assertFalse(room.hasVisionPot)
+        self.assertTrue(room.hasPit)
+
+    def test_populate_from_rolls_empty(self):
+        """Test that rolls at or above the item chance leave the room empty."""
+        room = Room()
+        room.populate_from_rolls((Room.ITEM_CHANCE, 0.9, 0.99))
+
+        self.assertFalse(room.hasHealthPot)
+        self.assertFalse(room.hasVisionPot)
+        self.assertFalse(room.hasPit)
+
+    def test_populate_from_rolls_offset(self):
+        """Test that a room reads its three rolls from the given start index."""
+        room = Room()
+        room.populate_from_rolls((0.0, 0.0, 0.9, 0.0, 0.9), 2)
+
+        self.assertFalse(room.hasHealthPot)
+        self.assertTrue(room.hasVisionPot)
+        self.assertFalse(room.hasPit)
+
+    def test_room_display_priority(self):
+        """Test the display character follows the room's state priorities."""
+        room = Room()
+        self.assertEqual(room.get_room_display(), Room.EMPTY)
+
+        room.hasPillar = True
+        room.pillarType = 'A'
+        self.assertEqual(room.get_room_display(), 'A')
+
+        room.hasPit = True
+        self.assertEqual(room.get_room_display(), Room.MULTIPLE_ITEMS)
+
+        # Monsters only show once the room has been visited
+        room.spawn_monster(force=True)
+        self.assertEqual(room.get_room_display(), Room.MULTIPLE_ITEMS)
+        self.assertEqual(room.get_room_display(visited=True), Room.MONSTER)
+
+        room.monster = None
+        room.hasPit = False
+        self.assertEqual(room.get_room_display(), 'A')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,7 +8,6 @@ from src.dungeon.room import Room
 def test_room_monsters():
     # Create a test room
     room = Room(sql_room)
-    room.visited = True  # So we can see the contents
 
     print("\n=== Room Monster Test ===")
 